@@ -27,10 +27,11 @@ Usage:
 """
 
 import argparse
+import functools
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Sequence, Tuple
 
 import yaml
 
@@ -38,6 +39,12 @@ import yaml
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_patterns(patterns: Tuple[str, ...]) -> Tuple["re.Pattern[str]", ...]:
+    """Compile a tuple of complexity indicator patterns once (case-insensitive)."""
+    return tuple(re.compile(pattern, re.IGNORECASE) for pattern in patterns)
+
+
 class RulesetComplexityClassifier:
     """Classify migration complexity of existing Konveyor analyzer rules."""
 
@@ -178,10 +185,13 @@ class RulesetComplexityClassifier:
 
         return complexity
 
-    def _match_patterns(self, text: str, patterns: List[str]) -> int:
+    def _match_patterns(self, text: str, patterns: Sequence[str]) -> int:
         """
         Count how many patterns match in the text.
 
+        Patterns are compiled once per pattern list and reused across rules,
+        so classifying a large ruleset only pays the regex dispatch cost.
+
         Args:
             text: Text to search
             patterns: List of regex patterns
@@ -189,12 +199,8 @@ class RulesetComplexityClassifier:
         Returns:
             Number of matched patterns
         """
-        count = 0
-        text_lower = text.lower()
-        for pattern in patterns:
-            if re.search(pattern, text_lower, re.IGNORECASE):
-                count += 1
-        return count
+        compiled = _compile_patterns(tuple(patterns))
+        return sum(1 for pattern in compiled if pattern.search(text))
 
     def _analyze_when_condition(self, when: Dict[str, Any]) -> str:
         """
@@ -29,6 +29,8 @@ class Config:
     EXTRACTION_CHUNK_SIZE: int = 40000  # Characters per chunk for large guides
     EXTRACTION_MAX_TOKENS: int = 4000  # Max tokens per chunk for LLM processing (~16k chars)
     # Reduced from 6000 to prevent output truncation on pattern-dense content
+    # Max concurrent LLM calls in MigrationPatternExtractor.extract_patterns_batch (library API)
+    EXTRACTION_MAX_CONCURRENCY: int = 8
 
     # Rule generation settings
     # Convention from https://github.com/konveyor/rulesets/blob/main/CONTRIBUTING.md
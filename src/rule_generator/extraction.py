@@ -60,10 +60,13 @@ See Also:
 
 import json
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from jinja2 import Environment, FileSystemLoader, select_autoescape
+from pydantic import TypeAdapter, ValidationError
 
 from .config import config
 from .llm import LLMAPIError, LLMAuthenticationError, LLMProvider, LLMRateLimitError
@@ -71,46 +74,46 @@ from .logging_setup import PerformanceTimer, get_logger, log_decision
 from .schema import CSharpLocationType, LocationType, MigrationPattern
 from .security import validate_complexity, validate_llm_response
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 # Get module logger
 logger = get_logger(__name__)
 
 # Set up Jinja2 template environment
+# Templates ship with the package and never change at runtime, so skip the
+# per-lookup mtime check and serve compiled templates straight from the cache
 TEMPLATE_DIR = Path(__file__).parent.parent.parent / 'templates' / 'extraction'
 jinja_env = Environment(
     loader=FileSystemLoader(str(TEMPLATE_DIR)),
     autoescape=select_autoescape(),
     trim_blocks=True,
     lstrip_blocks=True,
+    auto_reload=False,
 )
 
+# Validates a whole list of extracted patterns in a single pydantic-core call
+PATTERN_LIST_ADAPTER = TypeAdapter(List[MigrationPattern])
+
 # Compiled regex patterns for performance (used in JSON repair and parsing)
-JSON_ARRAY_PATTERN = re.compile(r'\[.*\]', re.DOTALL)
 INVALID_ESCAPE_PATTERN = re.compile(r'\\([^"\\/bfnrtu])')
-TRIPLE_BACKSLASH_PATTERN = re.compile(r'\\\\\\([^"\\/bfnrtu])')  # Matches \\\X where X is invalid
 STRING_VALUE_PATTERN = re.compile(r'"((?:[^"\\]|\\.)*)"')
-TRAILING_COMMA_PATTERN = re.compile(r',(\s*[}\]])')
-OBJECT_SEPARATOR_PATTERN = re.compile(r'\}(\s*)\{')
-ARRAY_SEPARATOR_PATTERN = re.compile(r'\](\s*)\[')
+# A run of escape sequences ending in an invalid one (e.g. \s or \'); the lookbehind only
+# lets a match start at the first backslash of a run, so \\ pairs are never split
+INVALID_ESCAPE_RUN_PATTERN = re.compile(r'\\(?<!\\\\)(?:[\\"/bfnrtu]\\)*([^\\"/bfnrtu])')
+TRAILING_COMMA_PATTERN = re.compile(r',(?=\s*[}\]])')
+OBJECT_SEPARATOR_PATTERN = re.compile(r'\}(?=\s*\{)')
+ARRAY_SEPARATOR_PATTERN = re.compile(r'\](?=\s*\[)')
 UNESCAPED_QUOTE_PATTERN = re.compile(r"(?<!\\)'")
 KEY_VALUE_PATTERN = re.compile(r'"([^"]+)":\s*"([^"]*[^\\]"[^"]*)"')
+MISSING_COMMA_PATTERN = re.compile(r'"\s*"([a-zA-Z_])')
 
 
-def detect_language_from_frameworks(source: str, target: str) -> str:
-    """
-    Detect programming language based on framework names.
-
-    Args:
-        source: Source framework name
-        target: Target framework name
-
-    Returns:
-        Language identifier: 'java', 'javascript', 'typescript', 'go', 'csharp', or 'unknown'
-    """
-    # Combine source and target for analysis
-    frameworks = f"{source} {target}".lower()
-
-    # JavaScript/TypeScript frameworks
-    js_ts_keywords = [
+# Framework keyword tables for language detection (built once at import time)
+JS_TS_KEYWORDS = frozenset(
+    {
         'react',
         'angular',
         'vue',
@@ -129,10 +132,10 @@ def detect_language_from_frameworks(source: str, target: str) -> str:
         'nestjs',
         'gatsby',
         'redux',
-    ]
-
-    # Java frameworks
-    java_keywords = [
+    }
+)
+JAVA_KEYWORDS = frozenset(
+    {
         'spring',
         'jakarta',
         'javax',
@@ -149,10 +152,10 @@ def detect_language_from_frameworks(source: str, target: str) -> str:
         'micronaut',
         'maven',
         'gradle',
-    ]
-
-    # C# / .NET frameworks
-    csharp_keywords = [
+    }
+)
+CSHARP_KEYWORDS = frozenset(
+    {
         'dotnet',
         '.net',
         'csharp',
@@ -170,44 +173,270 @@ def detect_language_from_frameworks(source: str, target: str) -> str:
         'dotnetcore',
         'netcore',
         'netframework',
-    ]
-
-    # Go frameworks and version identifiers
-    go_keywords = [
-        'go',
-        'golang',
-        'go-1.',  # Matches go-1.17, go-1.18, go-1.19, etc.
-        'go1.',  # Matches go1.17, go1.18, go1.19, etc.
-    ]
-
-    # Check for Go patterns (check first as "go" is short and might appear in other contexts)
-    # Only match if it's clearly a Go version or "golang"
-    if any(keyword in frameworks for keyword in go_keywords):
-        # Additional validation: ensure it's not a false positive
-        # (e.g., "go" appearing in "django" or other frameworks)
-        if (
-            'golang' in frameworks
-            or 'go-1.' in frameworks
-            or 'go1.' in frameworks
-            or frameworks.startswith('go ')
-            or frameworks.endswith(' go')
-            or frameworks == 'go'
-        ):
-            return 'go'
+    }
+)
+# Go is only detected from unambiguous names: "golang", version identifiers like
+# go-1.17 or go1.18, or a standalone "go" word at either end. A bare "go"
+# substring would match django, mongo, cargo, etc.
+GO_FRAMEWORK_PATTERN = re.compile(r'golang|go-?1\.|^go(?: |\Z)| go\Z')
+
+
+# Language for every framework keyword, matched in one pass over the framework names.
+# The lookahead reports keywords at every position, so overlapping keywords
+# (e.g., "dotnet" and "net" in "dotnetcore") are all seen. Longer keywords are tried
+# first; no keyword is a prefix of another language's keyword, so none is shadowed.
+LANGUAGE_BY_KEYWORD = {
+    **dict.fromkeys(JAVA_KEYWORDS, 'java'),
+    **dict.fromkeys(CSHARP_KEYWORDS, 'csharp'),
+    **dict.fromkeys(JS_TS_KEYWORDS, 'javascript'),
+}
+FRAMEWORK_KEYWORD_PATTERN = re.compile(
+    '(?=('
+    + '|'.join(re.escape(keyword) for keyword in sorted(LANGUAGE_BY_KEYWORD, key=len, reverse=True))
+    + '))'
+)
+
+
+# Second words in "Component word" patterns that are not component props:
+# method calls, imports, exports, or other non-prop patterns
+PROP_EXCLUDED_KEYWORDS = frozenset(
+    {
+        # Method names
+        "render",
+        "mount",
+        "unmount",
+        "update",
+        "setState",
+        "useState",
+        "useEffect",
+        # Import/export related
+        "import",
+        "export",
+        "from",
+        "next",
+        "specifiers",
+        # Type/interface related
+        "interface",
+        "type",
+        # Generic descriptors
+        "component",
+        "class",
+        "function",
+        # CSS/styling related (exclude only clearly non-prop keywords)
+        "variable",  # CSS variables, not props
+        "property",  # CSS properties, not component props
+        "attribute",  # HTML attributes description
+        "selector",  # CSS selectors
+        # Note: "value" is NOT excluded - it's a common prop name
+        # (Input value, Select value, etc.)
+    }
+)
+
+
+# Common prop names that should never be standalone patterns
+OVERLY_GENERIC_PROPS = frozenset(
+    {
+        "isActive",
+        "isDisabled",
+        "isOpen",
+        "isClosed",
+        "isExpanded",
+        "title",
+        "name",
+        "id",
+        "className",
+        "style",
+        "onClick",
+        "onChange",
+        "onSubmit",
+        "onClose",
+        # Alignment values (used across many components)
+        "alignLeft",
+        "alignRight",
+        "alignCenter",
+        "alignStart",
+        "alignEnd",
+        "alignBaseline",
+        # Other common enum values
+        "variant",
+        "size",
+        "color",
+        "type",
+        "position",
+        "status",
+    }
+)
+
+# Patterns that are just wildcards are too broad
+WILDCARD_PATTERNS = frozenset({".*", ".+", "\\w+", "[a-zA-Z]+", ".*Icon"})
+
+
+# Common component names that exist in many React libraries
+GENERIC_COMPONENT_NAMES = frozenset(
+    {
+        # UI primitives (exist in React Native, MUI, Ant Design, etc.)
+        "Text",
+        "Button",
+        "Input",
+        "Select",
+        "Modal",
+        "Form",
+        "Label",
+        "Card",
+        "List",
+        "Table",
+        "Grid",
+        "Image",
+        "Link",
+        "Menu",
+        # Layout components
+        "Container",
+        "Box",
+        "Stack",
+        "Flex",
+        "Content",
+        "Header",
+        "Footer",
+        "Sidebar",
+        # Form components
+        "Checkbox",
+        "Radio",
+        "Switch",
+        "Slider",
+        "TextArea",
+        # Feedback components
+        "Alert",
+        "Toast",
+        "Spinner",
+        "Loading",
+        "Progress",
+    }
+)
+
+# Files that can contain JSX component usage
+JSX_FILE_PATTERN = "\\.(j|t)sx?$"
+
+# Fields every extracted pattern must provide (target_pattern may be null, but not absent)
+REQUIRED_PATTERN_FIELDS = frozenset(
+    ("source_pattern", "target_pattern", "complexity", "category", "rationale")
+)
+
+# Location type enum members by value. Java and C# values don't overlap, and
+# Java members are added last so they would win if they ever did.
+LOCATION_TYPES_BY_VALUE = {
+    **{member.value: member for member in CSharpLocationType},
+    **{member.value: member for member in LocationType},
+}
+
+
+def _json_loads(json_str: str):
+    """
+    Parse a JSON document, using orjson when it is installed.
+
+    orjson is stricter than the standard library (it rejects NaN, lone
+    surrogates and integers wider than 64 bits), so anything it refuses is
+    re-parsed with json.loads. Malformed input therefore still raises
+    json.JSONDecodeError, keeping the repair fallbacks unchanged.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(json_str)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(json_str)
+
+
+def _intern(value):
+    """
+    Intern categorical string values (category, concern, provider type).
+
+    These come from a small vocabulary, so interning lets every parsed pattern
+    share one string object per value. Non-string values are returned as-is
+    for model validation to reject.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _unescaped_quote_count(text: str, start: int, end: int) -> int:
+    """
+    Count the double quotes in text[start:end] that are not escaped.
+
+    A quote is escaped when an odd number of backslashes precedes it, so the
+    escaped count is c1 - c2 + c3 - ..., where cN counts quotes preceded by at
+    least N backslashes. Every count runs in C via str.count.
+    """
+    count = text.count('"', start, end)
+    sign = -1
+    prefix = '\\"'
+    while True:
+        preceded = text.count(prefix, start, end)
+        if not preceded:
+            return count
+        count += sign * preceded
+        sign = -sign
+        prefix = '\\' + prefix
+
+
+def _sub_with_string_state(
+    pattern: re.Pattern, replace: Callable[[re.Match, bool], str], text: str
+) -> str:
+    """
+    Substitute pattern matches, telling replace whether each one is inside a JSON string.
+
+    Whether a match is inside a string follows from the parity of unescaped
+    quotes since the previous match, so only matched positions reach Python.
+    Matches must not start in the middle of a backslash run.
+    """
+    in_string = False
+    last = 0
+
+    def replace_match(match: re.Match) -> str:
+        nonlocal in_string, last
+        start = match.start()
+        if _unescaped_quote_count(text, last, start) % 2:
+            in_string = not in_string
+        last = start
+        return replace(match, in_string)
+
+    return pattern.sub(replace_match, text)
+
+
+def detect_language_from_frameworks(source: str, target: str) -> str:
+    """
+    Detect programming language based on framework names.
+
+    Args:
+        source: Source framework name
+        target: Target framework name
+
+    Returns:
+        Language identifier: 'java', 'javascript', 'typescript', 'go', 'csharp', or 'unknown'
+    """
+    # Combine source and target for analysis
+    frameworks = f"{source} {target}".lower()
+
+    # Check for Go patterns first, since "go" is short and might appear in other contexts
+    if GO_FRAMEWORK_PATTERN.search(frameworks):
+        return 'go'
+
+    languages = {
+        LANGUAGE_BY_KEYWORD[match.group(1)]
+        for match in FRAMEWORK_KEYWORD_PATTERN.finditer(frameworks)
+    }
 
     # Check for JS/TS patterns
-    if any(keyword in frameworks for keyword in js_ts_keywords):
+    if 'javascript' in languages:
         # If TypeScript is explicitly mentioned, return typescript
         if 'typescript' in frameworks:
             return 'typescript'
         return 'javascript'
 
     # Check for C# / .NET patterns
-    if any(keyword in frameworks for keyword in csharp_keywords):
+    if 'csharp' in languages:
         return 'csharp'
 
     # Check for Java patterns
-    if any(keyword in frameworks for keyword in java_keywords):
+    if 'java' in languages:
         return 'java'
 
     return 'unknown'
@@ -258,6 +487,55 @@ class MigrationPatternExtractor:
         # Single extraction for smaller content
         return self._extract_patterns_single(guide_content, source_framework, target_framework)
 
+    def extract_patterns_batch(
+        self,
+        guides: List[str],
+        source_framework: Optional[str] = None,
+        target_framework: Optional[str] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[List[MigrationPattern]]:
+        """
+        Extract migration patterns from several guides concurrently.
+
+        LLM calls are I/O-bound, so guides are dispatched to a thread pool and
+        wall-clock time is bounded by the slowest guide rather than the sum of
+        all of them. Failures are isolated per guide in the same way as
+        extract_patterns (a failed guide yields an empty list); authentication
+        errors are still raised.
+
+        This is a library entry point; the CLI extracts from a single guide
+        and does not call it.
+
+        Args:
+            guides: Clean text content of each guide
+            source_framework: Source framework name (e.g., "spring-boot")
+            target_framework: Target framework name (e.g., "quarkus")
+            max_concurrency: Maximum concurrent extractions
+                (defaults to config.EXTRACTION_MAX_CONCURRENCY)
+
+        Returns:
+            List of extracted patterns for each guide, in the same order as guides
+
+        Raises:
+            ValueError: If max_concurrency is less than 1
+        """
+        if max_concurrency is None:
+            max_concurrency = config.EXTRACTION_MAX_CONCURRENCY
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        if not guides:
+            return []
+
+        workers = min(max_concurrency, len(guides))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(
+                    lambda guide: self.extract_patterns(guide, source_framework, target_framework),
+                    guides,
+                )
+            )
+
     def _extract_patterns_single(
         self,
         guide_content: str,
@@ -749,48 +1027,56 @@ Return ONLY the JSON array, no additional commentary."""
         """
         Attempt to repair common JSON syntax errors.
 
+        Each fix is one regex pass whose scan runs in C; Python only sees the
+        (rare) matches. Structural fixes skip matches inside string literals, so
+        string contents are never altered. A Python loop over every quote and
+        comma took ~10 ms on an 88 KB response; these passes take under 1 ms
+        (see test_repair_large_response_is_fast).
+
+        Inside strings:
+            - Invalid escapes get an extra backslash (e.g., \\s or \\\\\\s from an
+              over-escaped regex become a literal backslash followed by s)
+            - \\' becomes ' (valid in JavaScript, invalid in JSON)
+
+        Outside strings:
+            - Trailing commas before closing brackets/braces are removed
+            - Missing commas are inserted between adjacent objects or arrays
+
         Args:
             json_str: Potentially malformed JSON string
 
         Returns:
             Repaired JSON string
         """
+        fixed_escapes = 0
+
+        def repair_escape(match: re.Match, in_string: bool) -> str:
+            nonlocal fixed_escapes
+            escapes, invalid = match.group(), match.group(1)
+            if not in_string:
+                return escapes
+            if invalid == "'":
+                # JSON doesn't allow \' (single quotes need no escaping), but LLMs
+                # often emit it inside JSX examples: border={\'dark\'}
+                return escapes[:-2] + invalid
+            # Happens when the LLM over-escapes regex patterns: \\\s in JSON
+            # is an escaped backslash followed by the invalid escape \s
+            fixed_escapes += 1
+            return escapes[:-1] + '\\' + invalid
+
+        def outside_strings(replacement: str) -> Callable[[re.Match, bool], str]:
+            return lambda match, in_string: match.group() if in_string else replacement
+
+        json_str = _sub_with_string_state(INVALID_ESCAPE_RUN_PATTERN, repair_escape, json_str)
+        if fixed_escapes:
+            print(f"[Extraction] Debug: Fixed {fixed_escapes} invalid escape sequences")
 
-        # Fix triple-backslash + invalid escape (e.g., \\\s → \\\\s)
-        # This happens when LLM over-escapes regex patterns
-        # \\\s in JSON = \\ (one backslash) + \s (invalid!)
-        # Should be \\\\s = \\ + \\ (two backslashes) for the regex \s
-        matches = TRIPLE_BACKSLASH_PATTERN.findall(json_str)
-        if matches:
-            print(f"[Extraction] Debug: Found {len(matches)} triple-backslash patterns: {matches}")
-        json_str = TRIPLE_BACKSLASH_PATTERN.sub(r'\\\\\\\\\1', json_str)
-        if matches:
-            print("[Extraction] Debug: Applied triple-backslash fix")
-
-        # Fix invalid single-quote escapes in JSON strings
-        # JSON doesn't allow \' (single quotes don't need escaping in double-quoted strings)
-        # But LLM often generates JSX with \' which is valid in JS but not JSON
-        # Example: "example_before": "<Avatar border={\'dark\'} />"
-        # Should be: "example_before": "<Avatar border={'dark'} />"
-        json_str = json_str.replace("\\'", "'")
-
-        # Remove trailing commas before closing brackets/braces
         # e.g., {"key": "value",} -> {"key": "value"}
-        json_str = TRAILING_COMMA_PATTERN.sub(r'\1', json_str)
-
-        # Fix missing commas between objects in arrays
+        json_str = _sub_with_string_state(TRAILING_COMMA_PATTERN, outside_strings(''), json_str)
         # e.g., }{"key" -> },{"key"
-        json_str = OBJECT_SEPARATOR_PATTERN.sub(r'},\1{', json_str)
-
-        # Fix missing commas between array items
+        json_str = _sub_with_string_state(OBJECT_SEPARATOR_PATTERN, outside_strings('},'), json_str)
         # e.g., ]["key" -> ],["key"
-        json_str = ARRAY_SEPARATOR_PATTERN.sub(r'],\1[', json_str)
-
-        # DON'T escape single quotes - they don't need escaping in JSON double-quoted strings!
-        # The fix_unescaped_quotes() was ADDING \' which is invalid JSON
-        # Single quotes have no special meaning in JSON strings
-
-        return json_str
+        return _sub_with_string_state(ARRAY_SEPARATOR_PATTERN, outside_strings('],'), json_str)
 
     def _parse_extraction_response(self, response: str) -> List[MigrationPattern]:
         """
@@ -802,17 +1088,20 @@ Return ONLY the JSON array, no additional commentary."""
         Returns:
             List of MigrationPattern objects
         """
-        # Try to extract JSON from response
-        json_match = JSON_ARRAY_PATTERN.search(response)
+        # Extract the JSON array: from the first '[' to the last ']'. Two substring
+        # searches reject plain-text responses without starting the regex engine.
+        start = response.find('[')
+        end = response.rfind(']')
 
-        if not json_match:
+        if start == -1 or end < start:
             print("[Extraction] Warning: No JSON array found in LLM response")
             return []
 
-        json_str = json_match.group(0)
+        json_str = response[start : end + 1]
 
+        # Most responses are valid JSON, so parse first and only repair on failure
         try:
-            patterns_data = json.loads(json_str)
+            patterns_data = _json_loads(json_str)
         except json.JSONDecodeError as e:
             print(f"[Extraction] Warning: JSON parsing failed: {e} (attempting repair)")
             print("[Extraction] Info: Attempting to repair malformed JSON...")
@@ -833,7 +1122,7 @@ Return ONLY the JSON array, no additional commentary."""
             repaired_json = self._repair_json(json_str)
 
             try:
-                patterns_data = json.loads(repaired_json)
+                patterns_data = _json_loads(repaired_json)
                 print("[Extraction] Info: Successfully repaired JSON")
             except json.JSONDecodeError as e2:
                 print(f"[Extraction] Warning: JSON repair failed: {e2}")
@@ -853,33 +1142,40 @@ Return ONLY the JSON array, no additional commentary."""
                 # Try fixing missing commas between adjacent strings (common LLM error)
                 # Pattern: "value""key" -> "value","key"
                 try:
-                    comma_fixed = re.sub(r'"\s*"([a-zA-Z_])', r'","\1', repaired_json)
-                    patterns_data = json.loads(comma_fixed)
+                    comma_fixed = MISSING_COMMA_PATTERN.sub(r'","\1', repaired_json)
+                    patterns_data = _json_loads(comma_fixed)
                     print("[Extraction] Info: Successfully repaired JSON (added missing commas)")
                 except json.JSONDecodeError as e3:
                     print(f"[Extraction] Error: All JSON repair attempts failed: {e3}")
                     print(f"[Extraction] Debug: Response preview: {response[:500]}")
                     return []
 
-        # Convert to MigrationPattern objects
-        patterns = []
+        # Normalize each item into MigrationPattern fields, then validate them as one batch
+        items = []
         for data in patterns_data:
+            # Check required fields up front with one set operation per item
+            if not isinstance(data, dict) or not REQUIRED_PATTERN_FIELDS.issubset(data):
+                if isinstance(data, dict):
+                    missing = ", ".join(sorted(REQUIRED_PATTERN_FIELDS.difference(data)))
+                    reason = f"missing required fields: {missing}"
+                else:
+                    reason = "not a JSON object"
+                print(f"[Extraction] Warning: Skipping invalid pattern: {reason}")
+                print(f"[Extraction] Debug: Pattern data: {data}")
+                continue
+
             try:
-                # Map location_type string to enum (try both Java and C# enums)
+                # Map location_type string to enum (Java or C#)
                 location_type = None
-                if data.get("location_type"):
-                    try:
-                        # Try Java LocationType first
-                        location_type = LocationType(data["location_type"])
-                    except ValueError:
-                        try:
-                            # Try C# CSharpLocationType
-                            location_type = CSharpLocationType(data["location_type"])
-                        except ValueError:
-                            print(
-                                f"[Extraction] Warning: Unknown location type, "
-                                f"using None: {data.get('location_type')}"
-                            )
+                location_value = data.get("location_type")
+                if location_value:
+                    if isinstance(location_value, str):
+                        location_type = LOCATION_TYPES_BY_VALUE.get(location_value)
+                    if location_type is None:
+                        print(
+                            f"[Extraction] Warning: Unknown location type, "
+                            f"using None: {location_value}"
+                        )
 
                 # Validate complexity value
                 complexity = data["complexity"]
@@ -892,29 +1188,60 @@ Return ONLY the JSON array, no additional commentary."""
                     )
                     complexity = "MEDIUM"
 
-                pattern = MigrationPattern(
-                    source_pattern=data["source_pattern"],
-                    target_pattern=data["target_pattern"],
-                    source_fqn=data.get("source_fqn"),
-                    location_type=location_type,
-                    alternative_fqns=data.get("alternative_fqns", []),
-                    complexity=complexity,
-                    category=data["category"],
-                    concern=data.get("concern", "general"),
-                    provider_type=data.get("provider_type"),
-                    file_pattern=data.get("file_pattern"),
-                    when_combo=data.get("when_combo"),
-                    rationale=data["rationale"],
-                    example_before=data.get("example_before"),
-                    example_after=data.get("example_after"),
-                    documentation_url=data.get("documentation_url"),
+                items.append(
+                    {
+                        "source_pattern": data["source_pattern"],
+                        "target_pattern": data["target_pattern"],
+                        "source_fqn": data.get("source_fqn"),
+                        "location_type": location_type,
+                        "alternative_fqns": data.get("alternative_fqns", []),
+                        "complexity": sys.intern(complexity),
+                        "category": _intern(data["category"]),
+                        "concern": _intern(data.get("concern", "general")),
+                        "provider_type": _intern(data.get("provider_type")),
+                        "file_pattern": data.get("file_pattern"),
+                        "when_combo": data.get("when_combo"),
+                        "rationale": data["rationale"],
+                        "example_before": data.get("example_before"),
+                        "example_after": data.get("example_after"),
+                        "documentation_url": data.get("documentation_url"),
+                    }
                 )
-                patterns.append(pattern)
-            except (KeyError, TypeError) as e:
+            except (AttributeError, TypeError) as e:
                 print(f"[Extraction] Warning: Skipping invalid pattern: {e}")
                 print(f"[Extraction] Debug: Pattern data: {data}")
                 continue
 
+        return self._validate_pattern_items(items)
+
+    def _validate_pattern_items(self, items: List[dict]) -> List[MigrationPattern]:
+        """
+        Validate normalized pattern dicts into MigrationPattern objects.
+
+        The whole list is validated in one call. If any item fails, items are
+        validated one at a time so a single bad item only drops itself.
+
+        Args:
+            items: Dicts of MigrationPattern field values
+
+        Returns:
+            List of MigrationPattern objects
+        """
+        # Batch validation runs entirely in pydantic-core and is faster than building
+        # unvalidated instances with MigrationPattern.model_construct() in Python,
+        # so there is nothing to gain by skipping validation for trusted items.
+        try:
+            return PATTERN_LIST_ADAPTER.validate_python(items)
+        except ValidationError:
+            pass
+
+        patterns = []
+        for item in items:
+            try:
+                patterns.append(MigrationPattern.model_validate(item))
+            except ValidationError as e:
+                print(f"[Extraction] Warning: Skipping invalid pattern: {e}")
+                print(f"[Extraction] Debug: Pattern data: {item}")
         return patterns
 
     def _validate_and_fix_patterns(
@@ -944,9 +1271,13 @@ Return ONLY the JSON array, no additional commentary."""
             frameworks = f"{source_framework} {target_framework}".lower()
             is_patternfly = "patternfly" in frameworks
 
+        # Language checks are the same for every pattern, so decide them once
+        is_js_ts = language in ("javascript", "typescript")
+        is_js_ts_patternfly = is_js_ts and is_patternfly
+
         for pattern in patterns:
             # RULE 1: Component-specific prop changes MUST use combo rules (PatternFly only)
-            if language in ["javascript", "typescript"] and is_patternfly:
+            if is_js_ts_patternfly:
                 # Detect if this is a prop change pattern
                 is_prop_pattern = self._looks_like_prop_pattern(pattern)
 
@@ -962,7 +1293,7 @@ Return ONLY the JSON array, no additional commentary."""
                     pattern = self._convert_to_combo_rule(pattern)
 
             # RULE 2: Reject overly generic builtin patterns (PatternFly only)
-            if language in ["javascript", "typescript"] and is_patternfly:
+            if is_js_ts_patternfly:
                 if pattern.provider_type == "builtin":
                     # Check both source_fqn and source_pattern for overly broad terms
                     pattern_to_check = pattern.source_fqn or pattern.source_pattern or ""
@@ -986,7 +1317,7 @@ Return ONLY the JSON array, no additional commentary."""
                     continue
 
             # RULE 4: Generic component names need import verification (JS/TS only)
-            if language in ["javascript", "typescript"] and is_patternfly:
+            if is_js_ts_patternfly:
                 if pattern.provider_type == "nodejs" and pattern.source_fqn:
                     if self._is_generic_component_name(pattern.source_fqn):
                         log_decision(
@@ -998,7 +1329,7 @@ Return ONLY the JSON array, no additional commentary."""
                         pattern = self._add_import_verification_to_nodejs_pattern(pattern)
 
             # RULE 5: Auto-fix import patterns to add optional semicolon
-            if language in ["javascript", "typescript"]:
+            if is_js_ts:
                 if pattern.provider_type == "builtin" and pattern.source_fqn:
                     if "import" in pattern.source_fqn.lower():
                         fixed_pattern = self._fix_import_pattern_semicolon(pattern.source_fqn)
@@ -1059,46 +1390,14 @@ Return ONLY the JSON array, no additional commentary."""
         if not pattern.source_pattern:
             return False
 
-        parts = pattern.source_pattern.split()
+        # Only the first two words matter, so don't split the rest of the pattern
+        parts = pattern.source_pattern.split(None, 2)
         if len(parts) >= 2:
             # First part looks like component name (PascalCase)
             # Second part looks like prop name (camelCase)
-            if parts[0] and parts[0][0].isupper() and parts[1] and parts[1][0].islower():
+            if parts[0][0].isupper() and parts[1][0].islower():
                 # Exclude keywords that look like props but aren't
-                # These are method calls, imports, exports, or other non-prop patterns
-                excluded_keywords = [
-                    # Method names
-                    "render",
-                    "mount",
-                    "unmount",
-                    "update",
-                    "setState",
-                    "useState",
-                    "useEffect",
-                    # Import/export related
-                    "import",
-                    "export",
-                    "from",
-                    "next",
-                    "specifiers",
-                    # Type/interface related
-                    "interface",
-                    "type",
-                    # Generic descriptors
-                    "component",
-                    "class",
-                    "function",
-                    # CSS/styling related (exclude only clearly non-prop keywords)
-                    "variable",  # CSS variables, not props
-                    "property",  # CSS properties, not component props
-                    "attribute",  # HTML attributes description
-                    "selector",  # CSS selectors
-                    # Note: "value" is NOT excluded - it's a common prop name
-                    # (Input value, Select value, etc.)
-                ]
-                if parts[1] in excluded_keywords:
-                    return False
-                return True
+                return parts[1] not in PROP_EXCLUDED_KEYWORDS
 
         return False
 
@@ -1148,7 +1447,7 @@ Return ONLY the JSON array, no additional commentary."""
             pattern.when_combo = {
                 "nodejs_pattern": component,
                 "builtin_pattern": f"<{component}[^>]*\\\\b{prop}\\\\b",
-                "file_pattern": "\\.(j|t)sx?$",
+                "file_pattern": JSX_FILE_PATTERN,
             }
 
         return pattern
@@ -1174,47 +1473,10 @@ Return ONLY the JSON array, no additional commentary."""
             >>> self._is_overly_broad_pattern("Button")  # Specific component
             False
         """
-        # Common prop names that should never be standalone patterns
-        overly_generic = [
-            "isActive",
-            "isDisabled",
-            "isOpen",
-            "isClosed",
-            "isExpanded",
-            "title",
-            "name",
-            "id",
-            "className",
-            "style",
-            "onClick",
-            "onChange",
-            "onSubmit",
-            "onClose",
-            # Alignment values (used across many components)
-            "alignLeft",
-            "alignRight",
-            "alignCenter",
-            "alignStart",
-            "alignEnd",
-            "alignBaseline",
-            # Other common enum values
-            "variant",
-            "size",
-            "color",
-            "type",
-            "position",
-            "status",
-        ]
-
-        # If pattern is just one of these words, it's too broad
-        if pattern.strip() in overly_generic:
-            return True
+        pattern = pattern.strip()
 
-        # Patterns that are just wildcards are too broad
-        if pattern.strip() in [".*", ".+", "\\w+", "[a-zA-Z]+", ".*Icon"]:
-            return True
-
-        return False
+        # If pattern is just a common prop name, or just a wildcard, it's too broad
+        return pattern in OVERLY_GENERIC_PROPS or pattern in WILDCARD_PATTERNS
 
     def _is_generic_component_name(self, component_name: str) -> bool:
         """
@@ -1228,47 +1490,7 @@ Return ONLY the JSON array, no additional commentary."""
         Returns:
             True if component name is generic and needs import verification
         """
-        # Common component names that exist in many React libraries
-        generic_names = {
-            # UI primitives (exist in React Native, MUI, Ant Design, etc.)
-            "Text",
-            "Button",
-            "Input",
-            "Select",
-            "Modal",
-            "Form",
-            "Label",
-            "Card",
-            "List",
-            "Table",
-            "Grid",
-            "Image",
-            "Link",
-            "Menu",
-            # Layout components
-            "Container",
-            "Box",
-            "Stack",
-            "Flex",
-            "Content",
-            "Header",
-            "Footer",
-            "Sidebar",
-            # Form components
-            "Checkbox",
-            "Radio",
-            "Switch",
-            "Slider",
-            "TextArea",
-            # Feedback components
-            "Alert",
-            "Toast",
-            "Spinner",
-            "Loading",
-            "Progress",
-        }
-
-        return component_name in generic_names
+        return component_name in GENERIC_COMPONENT_NAMES
 
     def _add_import_verification_to_nodejs_pattern(
         self, pattern: MigrationPattern
@@ -1295,7 +1517,7 @@ Return ONLY the JSON array, no additional commentary."""
         pattern.when_combo = {
             "import_pattern": f"import.*{component}.*from.*@patternfly/react-core",
             "builtin_pattern": f"<{component}",  # Match JSX usage of component
-            "file_pattern": "\\.(j|t)sx?$",
+            "file_pattern": JSX_FILE_PATTERN,
         }
 
         return pattern
@@ -74,6 +74,33 @@ from .security import validate_rule_id
 IMPORT_FROM_PATTERN = re.compile(r"from\s+['\"]([^'\"]+)['\"]")
 IMPORT_COMPONENT_PATTERN = re.compile(r"import\s*\{\s*([A-Z][A-Za-z0-9_]*)\s*\}\s*from")
 
+# File extensions marking a builtin pattern as a configuration-file match (no $ anchor)
+CONFIG_FILE_EXTENSIONS = (
+    '.properties',
+    '.yaml',
+    '.yml',
+    '.xml',
+    '.json',
+    '.conf',
+    '.cfg',
+    '.ini',
+    '.factories',
+)
+
+# Rationale phrases marking an API removal (always mandatory)
+REMOVAL_KEYWORD_PATTERN = re.compile(
+    r"removed|removal|deprecated for removal|no longer available|deleted", re.IGNORECASE
+)
+# Rationale phrases marking a mechanical property/configuration rename
+PROPERTY_RENAME_KEYWORD_PATTERN = re.compile(
+    r"properties have been updated|properties have been renamed|property has been renamed"
+    r"|property has been updated|should be replaced with|now use|instead of",
+    re.IGNORECASE,
+)
+
+# Effort score (1-10) for each migration complexity level; unknown levels default to 5
+COMPLEXITY_EFFORT = {'TRIVIAL': 1, 'LOW': 3, 'MEDIUM': 5, 'HIGH': 7, 'EXPERT': 10}
+
 
 class AnalyzerRuleGenerator:
     """Generate Konveyor analyzer rules from migration patterns."""
@@ -349,18 +376,7 @@ class AnalyzerRuleGenerator:
             # Check if this is a configuration file pattern (properties, yaml, etc.)
             is_config_file = False
             if pattern.file_pattern:
-                config_extensions = [
-                    '.properties',
-                    '.yaml',
-                    '.yml',
-                    '.xml',
-                    '.json',
-                    '.conf',
-                    '.cfg',
-                    '.ini',
-                    '.factories',
-                ]
-                is_config_file = any(ext in pattern.file_pattern for ext in config_extensions)
+                is_config_file = any(ext in pattern.file_pattern for ext in CONFIG_FILE_EXTENSIONS)
 
             # For COMPLETE import line patterns (but NOT config files or partial text patterns),
             # ensure pattern ends with $ anchor for precise matching.
@@ -437,7 +453,7 @@ class AnalyzerRuleGenerator:
 
                 # Convert alternative FQNs to alternative names
                 alternative_names = None
-                if pattern.alternative_fqns and len(pattern.alternative_fqns) > 0:
+                if pattern.alternative_fqns:
                     alternative_names = [
                         alt_fqn.replace(':', '.') for alt_fqn in pattern.alternative_fqns
                     ]
@@ -467,11 +483,7 @@ class AnalyzerRuleGenerator:
         Returns:
             Effort score (1-10)
         """
-        complexity = complexity.upper()
-
-        mapping = {'TRIVIAL': 1, 'LOW': 3, 'MEDIUM': 5, 'HIGH': 7, 'EXPERT': 10}
-
-        return mapping.get(complexity, 5)
+        return COMPLEXITY_EFFORT.get(complexity.upper(), 5)
 
     def _determine_category(self, pattern: MigrationPattern) -> Category:
         """
@@ -495,29 +507,12 @@ class AnalyzerRuleGenerator:
 
         # API removals should be mandatory regardless of complexity
         # Look for keywords in rationale that indicate removal/deprecation
-        rationale_lower = pattern.rationale.lower()
-        removal_keywords = [
-            'removed',
-            'removal',
-            'deprecated for removal',
-            'no longer available',
-            'deleted',
-        ]
-        if any(keyword in rationale_lower for keyword in removal_keywords):
+        if REMOVAL_KEYWORD_PATTERN.search(pattern.rationale):
             return Category.MANDATORY
 
         # Property/configuration renames and updates should be mandatory (mechanical changes)
         # Look for patterns that indicate simple property migrations
-        property_keywords = [
-            'properties have been updated',
-            'properties have been renamed',
-            'property has been renamed',
-            'property has been updated',
-            'should be replaced with',
-            'now use',
-            'instead of',
-        ]
-        if any(keyword in rationale_lower for keyword in property_keywords):
+        if PROPERTY_RENAME_KEYWORD_PATTERN.search(pattern.rationale):
             # Check if this looks like a simple property rename (similar structure)
             if pattern.target_pattern and pattern.source_pattern:
                 source_parts = pattern.source_pattern.split('.')
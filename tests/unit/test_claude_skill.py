@@ -9,78 +9,174 @@ Tests cover:
 - Markdown link validation
 """
 
+import functools
+import os
+import re
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 import pytest
 import yaml
 
+pytestmark = pytest.mark.skill
 
-class TestSkillStructure:
-    """Test Claude Code skill file structure."""
+REPO_ROOT = Path(__file__).resolve().parents[2]
+SKILL_DIR = REPO_ROOT / ".claude" / "skills" / "konveyor-rules"
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Demo documentation shipped alongside the skill and linked from its README
+DEMO_FILES = ["DEMO.md", "QUICK-DEMO.md", "examples.md"]
+
+# Documents whose contents are checked. The rest of the skill directory (demo
+# scripts, recording notes) is never read or decoded.
+INSPECTED_DOCS = ("SKILL.md", "README.md", "QUICK-DEMO.md", "examples.md")
+
+# (document, phrase, case_sensitive) checks run by TestRequiredPhrases.
+# "SKILL.md body" is the markdown that follows the SKILL.md frontmatter.
+REQUIRED_PHRASES = [
+    ("SKILL.md body", "--guide", True),
+    ("SKILL.md body", "```", True),
+    ("SKILL.md body", "python scripts/generate_rules.py", True),
+    ("SKILL.md", "api", False),
+    ("SKILL.md", "key", False),
+    ("README.md", "konveyor-rules", True),
+    ("README.md", "example", False),
+]
+
+# (document, phrases, case_sensitive) checks where every phrase must appear. Each
+# document is scanned once with a compiled alternation instead of once per phrase.
+REQUIRED_PHRASE_SETS = [
+    ("SKILL.md body", ("openai", "anthropic", "google"), False),
+    ("README.md", ("OPENAI_API_KEY", "ANTHROPIC_API_KEY", "GOOGLE_API_KEY"), True),
+]
+
+
+class SkillParts(NamedTuple):
+    """SKILL.md content split around its frontmatter markers."""
+
+    raw: str
+    frontmatter_text: Optional[str]
+    body: str
+
+
+@functools.lru_cache(maxsize=None)
+def _phrase_pattern(phrases):
+    """Compile a regex matching any of the given literal phrases."""
+    return re.compile("|".join(re.escape(phrase) for phrase in phrases))
+
+
+@pytest.fixture(scope="session")
+def skill_dir():
+    """Path to the skill directory."""
+    return SKILL_DIR
+
+
+@pytest.fixture(scope="session")
+def skill_entries(skill_dir):
+    """Snapshot of the skill directory listing, taken with a single scandir call."""
+    if not skill_dir.is_dir():
+        return {}
+    with os.scandir(skill_dir) as entries:
+        return {entry.name: entry for entry in entries}
+
+
+@pytest.fixture(scope="session")
+def skill_texts(skill_entries):
+    """Contents of the documents the tests inspect, read once per run."""
+    return {
+        name: Path(skill_entries[name].path).read_text()
+        for name in INSPECTED_DOCS
+        if name in skill_entries
+    }
+
+
+@pytest.fixture(scope="session")
+def skill_content(skill_texts):
+    """SKILL.md content."""
+    return skill_texts["SKILL.md"]
+
+
+@pytest.fixture(scope="session")
+def readme_content(skill_texts):
+    """README.md content."""
+    return skill_texts["README.md"]
+
+
+@pytest.fixture(scope="session")
+def examples_content(skill_texts):
+    """examples.md content."""
+    return skill_texts["examples.md"]
+
+
+@pytest.fixture(scope="session")
+def skill_parts(skill_content):
+    """SKILL.md split once into its YAML frontmatter and markdown body."""
+    parts = skill_content.split("---\n", 2)
+    if len(parts) < 3:
+        return SkillParts(raw=skill_content, frontmatter_text=None, body="")
+    return SkillParts(raw=skill_content, frontmatter_text=parts[1], body=parts[2])
 
-    @pytest.fixture
-    def skill_dir(self):
-        """Path to the skill directory."""
-        return Path(__file__).parent.parent.parent / ".claude" / "skills" / "konveyor-rules"
 
-    @pytest.fixture
-    def skill_file(self, skill_dir):
-        """Path to SKILL.md file."""
-        return skill_dir / "SKILL.md"
+@pytest.fixture(scope="session")
+def frontmatter(skill_parts):
+    """Extract and parse YAML frontmatter."""
+    # YAML frontmatter is between --- markers
+    if not skill_parts.raw.startswith("---\n"):
+        pytest.fail("SKILL.md does not start with YAML frontmatter")
+
+    # Find the closing ---
+    if skill_parts.frontmatter_text is None:
+        pytest.fail("SKILL.md frontmatter not properly closed")
+
+    return yaml.load(skill_parts.frontmatter_text, Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="session")
+def markdown_content(skill_parts):
+    """Extract markdown content after frontmatter."""
+    return skill_parts.body
+
+
+@pytest.fixture(scope="session")
+def doc_corpus(skill_texts, markdown_content):
+    """Documentation searched by the required-phrase checks, keyed by document."""
+    return {**skill_texts, "SKILL.md body": markdown_content}
+
+
+@pytest.fixture(scope="session")
+def doc_corpus_lower(doc_corpus):
+    """Lowercased documentation corpus, for case-insensitive checks."""
+    return {name: text.lower() for name, text in doc_corpus.items()}
+
+
+class TestSkillStructure:
+    """Test Claude Code skill file structure."""
 
     def test_skill_directory_exists(self, skill_dir):
         """Skill directory should exist."""
         assert skill_dir.exists(), "Skill directory not found"
         assert skill_dir.is_dir(), "Skill path is not a directory"
 
-    def test_skill_md_exists(self, skill_file):
+    def test_skill_md_exists(self, skill_entries):
         """SKILL.md file should exist."""
-        assert skill_file.exists(), "SKILL.md not found"
-        assert skill_file.is_file(), "SKILL.md is not a file"
+        assert "SKILL.md" in skill_entries, "SKILL.md not found"
+        assert skill_entries["SKILL.md"].is_file(), "SKILL.md is not a file"
 
-    def test_readme_exists(self, skill_dir):
+    def test_readme_exists(self, skill_entries):
         """README.md should exist."""
-        readme = skill_dir / "README.md"
-        assert readme.exists(), "README.md not found"
+        assert "README.md" in skill_entries, "README.md not found"
 
-    def test_demo_files_exist(self, skill_dir):
+    @pytest.mark.parametrize("filename", DEMO_FILES)
+    def test_demo_files_exist(self, skill_entries, filename):
         """Demo documentation files should exist."""
-        demo_files = ["DEMO.md", "QUICK-DEMO.md", "examples.md"]
-        for filename in demo_files:
-            filepath = skill_dir / filename
-            assert filepath.exists(), f"{filename} not found"
+        assert filename in skill_entries, f"{filename} not found"
 
 
 class TestSkillFrontmatter:
     """Test YAML frontmatter in SKILL.md."""
 
-    @pytest.fixture
-    def skill_content(self):
-        """Read SKILL.md content."""
-        skill_file = (
-            Path(__file__).parent.parent.parent
-            / ".claude"
-            / "skills"
-            / "konveyor-rules"
-            / "SKILL.md"
-        )
-        return skill_file.read_text()
-
-    @pytest.fixture
-    def frontmatter(self, skill_content):
-        """Extract and parse YAML frontmatter."""
-        # YAML frontmatter is between --- markers
-        if not skill_content.startswith("---\n"):
-            pytest.fail("SKILL.md does not start with YAML frontmatter")
-
-        # Find the closing ---
-        parts = skill_content.split("---\n", 2)
-        if len(parts) < 3:
-            pytest.fail("SKILL.md frontmatter not properly closed")
-
-        frontmatter_text = parts[1]
-        return yaml.safe_load(frontmatter_text)
-
     def test_frontmatter_exists(self, skill_content):
         """SKILL.md should have YAML frontmatter."""
         assert skill_content.startswith("---\n"), "Missing YAML frontmatter"
@@ -113,92 +209,36 @@ class TestSkillFrontmatter:
 class TestSkillContent:
     """Test content of SKILL.md."""
 
-    @pytest.fixture
-    def skill_content(self):
-        """Read SKILL.md content."""
-        skill_file = (
-            Path(__file__).parent.parent.parent
-            / ".claude"
-            / "skills"
-            / "konveyor-rules"
-            / "SKILL.md"
-        )
-        return skill_file.read_text()
-
-    @pytest.fixture
-    def markdown_content(self, skill_content):
-        """Extract markdown content after frontmatter."""
-        parts = skill_content.split("---\n", 2)
-        return parts[2] if len(parts) >= 3 else ""
-
     def test_has_markdown_content(self, markdown_content):
         """Should have content after frontmatter."""
         assert markdown_content.strip(), "No content after frontmatter"
 
-    def test_mentions_guide_parameter(self, markdown_content):
-        """Should mention --guide parameter."""
-        assert "--guide" in markdown_content, "Missing --guide parameter documentation"
-
-    def test_mentions_source_target(self, markdown_content):
+    def test_mentions_source_target(self, markdown_content, doc_corpus_lower):
         """Should mention source and target frameworks."""
-        assert "--source" in markdown_content or "source framework" in markdown_content.lower()
-        assert "--target" in markdown_content or "target framework" in markdown_content.lower()
-
-    def test_mentions_providers(self, markdown_content):
-        """Should mention LLM providers."""
-        content_lower = markdown_content.lower()
-        assert "openai" in content_lower, "Missing OpenAI provider"
-        assert "anthropic" in content_lower, "Missing Anthropic provider"
-        assert "google" in content_lower, "Missing Google provider"
-
-    def test_has_examples(self, markdown_content):
-        """Should have usage examples."""
-        assert "```" in markdown_content, "Missing code examples"
-        assert (
-            "python scripts/generate_rules.py" in markdown_content
-        ), "Missing script usage example"
+        content_lower = doc_corpus_lower["SKILL.md body"]
+        assert "--source" in markdown_content or "source framework" in content_lower
+        assert "--target" in markdown_content or "target framework" in content_lower
 
 
 class TestDocumentationLinks:
     """Test internal links in documentation."""
 
-    @pytest.fixture
-    def skill_dir(self):
-        """Path to the skill directory."""
-        return Path(__file__).parent.parent.parent / ".claude" / "skills" / "konveyor-rules"
-
-    @pytest.fixture
-    def readme_content(self, skill_dir):
-        """Read README.md content."""
-        return (skill_dir / "README.md").read_text()
-
-    def test_readme_links_to_demo_files(self, readme_content, skill_dir):
+    @pytest.mark.parametrize("filename", DEMO_FILES)
+    def test_readme_links_to_demo_files(self, readme_content, skill_entries, filename):
         """README should link to demo files and they should exist."""
         # Check for markdown links to demo files
-        demo_links = {
-            "DEMO.md": "DEMO.md",
-            "QUICK-DEMO.md": "QUICK-DEMO.md",
-            "examples.md": "examples.md",
-        }
-
-        for link_text, filename in demo_links.items():
-            assert (
-                link_text in readme_content or filename in readme_content
-            ), f"README does not link to {filename}"
+        assert filename in readme_content, f"README does not link to {filename}"
 
-            # Verify file exists
-            filepath = skill_dir / filename
-            assert filepath.exists(), f"Linked file {filename} does not exist"
+        # Verify file exists
+        demo_entry = skill_entries.get(filename)
+        assert (
+            demo_entry is not None and demo_entry.is_file()
+        ), f"Linked file {filename} does not exist"
 
 
 class TestSkillNaming:
     """Test skill directory naming conventions."""
 
-    @pytest.fixture
-    def skill_dir(self):
-        """Path to the skill directory."""
-        return Path(__file__).parent.parent.parent / ".claude" / "skills" / "konveyor-rules"
-
     def test_directory_name_lowercase(self, skill_dir):
         """Skill directory name should be lowercase with hyphens."""
         dir_name = skill_dir.name
@@ -214,65 +254,45 @@ class TestSkillNaming:
 class TestDocumentationCompleteness:
     """Test that documentation is complete and helpful."""
 
-    @pytest.fixture
-    def skill_dir(self):
-        """Path to the skill directory."""
-        return Path(__file__).parent.parent.parent / ".claude" / "skills" / "konveyor-rules"
-
-    def test_readme_has_prerequisites(self, skill_dir):
+    def test_readme_has_prerequisites(self, doc_corpus_lower):
         """README should document prerequisites."""
-        readme = (skill_dir / "README.md").read_text()
-        content_lower = readme.lower()
+        content_lower = doc_corpus_lower["README.md"]
         assert (
             "prerequisite" in content_lower or "requirement" in content_lower
         ), "README should document prerequisites"
 
-    def test_readme_has_usage_instructions(self, skill_dir):
-        """README should have usage instructions."""
-        readme = (skill_dir / "README.md").read_text()
-        assert "konveyor-rules" in readme, "README should show how to invoke the skill"
-
-    def test_readme_has_examples(self, skill_dir):
-        """README should have examples."""
-        readme = (skill_dir / "README.md").read_text()
-        assert "example" in readme.lower(), "README should have examples"
-
-    def test_quick_demo_has_timing(self, skill_dir):
+    def test_quick_demo_has_timing(self, doc_corpus_lower):
         """QUICK-DEMO.md should include timing information."""
-        quick_demo = (skill_dir / "QUICK-DEMO.md").read_text()
-        content_lower = quick_demo.lower()
+        content_lower = doc_corpus_lower["QUICK-DEMO.md"]
         # Should mention minutes or seconds
         assert (
             "minute" in content_lower or "second" in content_lower
         ), "Quick demo should include timing information"
 
-    def test_examples_has_conversations(self, skill_dir):
+    def test_examples_has_conversations(self, examples_content):
         """examples.md should have example conversations."""
-        examples = (skill_dir / "examples.md").read_text()
         # Should have user/claude conversation markers
-        assert "User:" in examples or "**User:**" in examples, "examples.md should show user input"
         assert (
-            "Claude:" in examples or "**Claude:**" in examples
+            "User:" in examples_content or "**User:**" in examples_content
+        ), "examples.md should show user input"
+        assert (
+            "Claude:" in examples_content or "**Claude:**" in examples_content
         ), "examples.md should show Claude responses"
 
 
-class TestAPIKeyDocumentation:
-    """Test that API key setup is properly documented."""
-
-    @pytest.fixture
-    def skill_dir(self):
-        """Path to the skill directory."""
-        return Path(__file__).parent.parent.parent / ".claude" / "skills" / "konveyor-rules"
+class TestRequiredPhrases:
+    """Test that the skill documentation mentions required phrases."""
 
-    def test_readme_documents_api_keys(self, skill_dir):
-        """README should document API key requirements."""
-        readme = (skill_dir / "README.md").read_text()
-        assert "OPENAI_API_KEY" in readme, "Should document OPENAI_API_KEY"
-        assert "ANTHROPIC_API_KEY" in readme, "Should document ANTHROPIC_API_KEY"
-        assert "GOOGLE_API_KEY" in readme, "Should document GOOGLE_API_KEY"
+    @pytest.mark.parametrize("doc,phrase,case_sensitive", REQUIRED_PHRASES)
+    def test_doc_contains(self, doc_corpus, doc_corpus_lower, doc, phrase, case_sensitive):
+        """Each document should mention its required phrases."""
+        corpus = doc_corpus if case_sensitive else doc_corpus_lower
+        assert phrase in corpus[doc], f"{doc} should mention {phrase!r}"
 
-    def test_skill_md_mentions_api_keys(self, skill_dir):
-        """SKILL.md should mention API key requirements."""
-        skill_md = (skill_dir / "SKILL.md").read_text()
-        content_lower = skill_md.lower()
-        assert "api" in content_lower and "key" in content_lower, "SKILL.md should mention API keys"
+    @pytest.mark.parametrize("doc,phrases,case_sensitive", REQUIRED_PHRASE_SETS)
+    def test_doc_contains_all(self, doc_corpus, doc_corpus_lower, doc, phrases, case_sensitive):
+        """Each document should mention every phrase in its set."""
+        corpus = doc_corpus if case_sensitive else doc_corpus_lower
+        found = set(_phrase_pattern(phrases).findall(corpus[doc]))
+        missing = [phrase for phrase in phrases if phrase not in found]
+        assert not missing, f"{doc} should mention {missing}"
@@ -5,103 +5,146 @@ Tests pattern extraction logic, language detection, and LLM response parsing.
 """
 
 import json
+import timeit
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
 
-from src.rule_generator.extraction import MigrationPatternExtractor, detect_language_from_frameworks
+from src.rule_generator.config import config
+from src.rule_generator.extraction import (
+    PATTERN_LIST_ADAPTER,
+    MigrationPatternExtractor,
+    detect_language_from_frameworks,
+)
+from src.rule_generator.llm import LLMAuthenticationError
 from src.rule_generator.schema import CSharpLocationType, LocationType, MigrationPattern
 
+# Minimal valid LLM pattern item; tests override individual fields via pattern_response()
+BASE_PATTERN = {
+    "source_pattern": "test",
+    "target_pattern": "new",
+    "complexity": "TRIVIAL",
+    "category": "api",
+    "rationale": "Test",
+}
+
+
+def pattern_response(**overrides):
+    """Render an LLM response holding BASE_PATTERN with the given fields overridden."""
+    return json.dumps([{**BASE_PATTERN, **overrides}])
+
+
+# Responses differing from BASE_PATTERN in one field, rendered once at import
+FIELD_VALUE_RESPONSES = {
+    (field, value): pattern_response(**{field: value})
+    for field, values in [
+        ("complexity", ["TRIVIAL", "LOW", "MEDIUM", "HIGH", "EXPERT"]),
+        ("category", ["dependency", "annotation", "api", "configuration", "other"]),
+    ]
+    for value in values
+}
+
+# Pattern lists for the _deduplicate_patterns tests, built once (deduplication never mutates them)
+DEDUP_CASES = {
+    "same_fqn": (
+        MigrationPattern(
+            source_pattern="test1",
+            source_fqn="com.example.Test",
+            concern="api",
+            rationale="First",
+            complexity="low",
+            category="api",
+        ),
+        MigrationPattern(
+            source_pattern="test2",
+            source_fqn="com.example.Test",  # Same FQN
+            concern="api",  # Same concern
+            rationale="Duplicate",
+            complexity="low",
+            category="api",
+        ),
+        MigrationPattern(
+            source_pattern="test3",
+            source_fqn="com.example.Other",  # Different FQN
+            concern="api",
+            rationale="Different",
+            complexity="low",
+            category="api",
+        ),
+    ),
+    "different_concern": (
+        MigrationPattern(
+            source_pattern="test",
+            source_fqn="com.example.Test",
+            concern="api",
+            rationale="API concern",
+            complexity="low",
+            category="api",
+        ),
+        MigrationPattern(
+            source_pattern="test",
+            source_fqn="com.example.Test",  # Same FQN
+            concern="configuration",  # Different concern
+            rationale="Config concern",
+            complexity="low",
+            category="api",
+        ),
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def mock_llm_provider():
+    """Stand-in LLM provider shared by tests that never inspect its calls."""
+    return SimpleNamespace(generate=lambda *args, **kwargs: {"response": "[]"})
+
+
+@pytest.fixture(scope="module")
+def extractor(mock_llm_provider):
+    """Create a MigrationPatternExtractor shared across the module (it holds no parse state)."""
+    return MigrationPatternExtractor(mock_llm_provider)
+
 
 class TestLanguageDetection:
     """Test language detection from framework names."""
 
-    def test_detect_java_from_spring(self):
-        """Should detect Java from Spring framework names"""
-        result = detect_language_from_frameworks("spring-boot-2", "spring-boot-3")
-        assert result == "java"
-
-    def test_detect_java_from_jakarta(self):
-        """Should detect Java from Jakarta framework names"""
-        result = detect_language_from_frameworks("javax", "jakarta")
-        assert result == "java"
-
-    def test_detect_java_from_jdk(self):
-        """Should detect Java from JDK version names"""
-        result = detect_language_from_frameworks("openjdk-11", "openjdk-17")
-        assert result == "java"
-
-    def test_detect_javascript_from_react(self):
-        """Should detect JavaScript from React framework names"""
-        result = detect_language_from_frameworks("react-16", "react-18")
-        assert result == "javascript"
-
-    def test_detect_javascript_from_node(self):
-        """Should detect JavaScript from Node framework names"""
-        result = detect_language_from_frameworks("node-14", "node-20")
-        assert result == "javascript"
-
-    def test_detect_typescript_when_explicitly_mentioned(self):
-        """Should detect TypeScript when explicitly mentioned"""
-        result = detect_language_from_frameworks("typescript-4", "typescript-5")
-        assert result == "typescript"
-
-    def test_detect_javascript_from_patternfly(self):
-        """Should detect JavaScript from PatternFly framework names"""
-        result = detect_language_from_frameworks("patternfly-v5", "patternfly-v6")
-        assert result == "javascript"
-
-    def test_detect_unknown_for_generic_names(self):
-        """Should return unknown for unrecognized framework names"""
-        result = detect_language_from_frameworks("framework-v1", "framework-v2")
-        assert result == "unknown"
-
-    def test_case_insensitive_detection(self):
-        """Should detect language case-insensitively"""
-        result = detect_language_from_frameworks("Spring-Boot-3", "SPRING-BOOT-4")
-        assert result == "java"
-
-    def test_detect_csharp_from_dotnet(self):
-        """Should detect C# from .NET framework names"""
-        result = detect_language_from_frameworks("dotnetframework", "dotnet8")
-        assert result == "csharp"
-
-    def test_detect_csharp_from_aspnet(self):
-        """Should detect C# from ASP.NET framework names"""
-        result = detect_language_from_frameworks("aspnet-mvc-5", "aspnet-core-8")
-        assert result == "csharp"
-
-    def test_detect_csharp_from_csharp_keyword(self):
-        """Should detect C# when 'csharp' or 'c#' is mentioned"""
-        result = detect_language_from_frameworks("csharp-10", "csharp-11")
-        assert result == "csharp"
-
-    def test_detect_csharp_from_netcore(self):
-        """Should detect C# from .NET Core framework names"""
-        result = detect_language_from_frameworks("netcore-3.1", "dotnet-6")
-        assert result == "csharp"
-
-    def test_detect_csharp_from_entityframework(self):
-        """Should detect C# from Entity Framework names"""
-        result = detect_language_from_frameworks("entityframework-6", "ef-core-7")
-        assert result == "csharp"
+    @pytest.mark.parametrize(
+        "source, target, expected",
+        [
+            pytest.param("spring-boot-2", "spring-boot-3", "java", id="java-spring"),
+            pytest.param("javax", "jakarta", "java", id="java-jakarta"),
+            pytest.param("openjdk-11", "openjdk-17", "java", id="java-jdk"),
+            pytest.param("Spring-Boot-3", "SPRING-BOOT-4", "java", id="case-insensitive"),
+            pytest.param("react-16", "react-18", "javascript", id="javascript-react"),
+            pytest.param("node-14", "node-20", "javascript", id="javascript-node"),
+            pytest.param(
+                "patternfly-v5", "patternfly-v6", "javascript", id="javascript-patternfly"
+            ),
+            pytest.param("typescript-4", "typescript-5", "typescript", id="typescript-explicit"),
+            pytest.param("dotnetframework", "dotnet8", "csharp", id="csharp-dotnet"),
+            pytest.param("aspnet-mvc-5", "aspnet-core-8", "csharp", id="csharp-aspnet"),
+            pytest.param("csharp-10", "csharp-11", "csharp", id="csharp-keyword"),
+            pytest.param("netcore-3.1", "dotnet-6", "csharp", id="csharp-netcore"),
+            pytest.param("entityframework-6", "ef-core-7", "csharp", id="csharp-entityframework"),
+            pytest.param("go-1.17", "go-1.18", "go", id="go-dashed-version"),
+            pytest.param("go1.20", "go1.21", "go", id="go-version"),
+            pytest.param("golang", "golang", "go", id="go-golang"),
+            pytest.param("go", "", "go", id="go-standalone"),
+            pytest.param("framework-v1", "framework-v2", "unknown", id="unknown-generic"),
+            # Names that merely contain "go" must not be detected as Go
+            pytest.param("django-3", "django-4", "unknown", id="unknown-django"),
+            pytest.param("mongo-driver-3", "mongo-driver-4", "unknown", id="unknown-mongo"),
+        ],
+    )
+    def test_detect_language(self, source, target, expected):
+        """Should map framework names to the language of their rules"""
+        assert detect_language_from_frameworks(source, target) == expected
 
 
 class TestPatternParsing:
     """Test parsing of LLM responses into MigrationPattern objects."""
 
-    @pytest.fixture
-    def mock_llm_provider(self):
-        """Create a mock LLM provider."""
-        mock = Mock()
-        mock.generate = Mock(return_value="Mock response")
-        return mock
-
-    @pytest.fixture
-    def extractor(self, mock_llm_provider):
-        """Create a MigrationPatternExtractor instance."""
-        return MigrationPatternExtractor(mock_llm_provider)
-
     def test_parse_valid_json_response(self, extractor):
         """Should parse valid JSON response into MigrationPattern objects"""
         response = '''[{
@@ -154,6 +197,52 @@ class TestPatternParsing:
         assert patterns[0].source_pattern == "Pattern1"
         assert patterns[1].source_pattern == "Pattern2"
 
+    def test_parse_validates_patterns_in_one_batch(self, extractor, monkeypatch):
+        """Should validate all patterns of a response with a single adapter call"""
+        batches = []
+
+        def validate_python(items):
+            batches.append(len(items))
+            return PATTERN_LIST_ADAPTER.validate_python(items)
+
+        monkeypatch.setattr(
+            "src.rule_generator.extraction.PATTERN_LIST_ADAPTER",
+            SimpleNamespace(validate_python=validate_python),
+        )
+        response = json.dumps([BASE_PATTERN] * 3)
+
+        patterns = extractor._parse_extraction_response(response)
+
+        assert len(patterns) == 3
+        assert batches == [3]
+
+    @pytest.mark.parametrize(
+        "field, value",
+        list(FIELD_VALUE_RESPONSES),
+        ids=lambda value: value,
+    )
+    def test_parse_field_values(self, extractor, field, value):
+        """Should parse every valid complexity level and category"""
+        patterns = extractor._parse_extraction_response(FIELD_VALUE_RESPONSES[field, value])
+
+        assert len(patterns) == 1
+        assert getattr(patterns[0], field) == value
+
+    def test_parse_shares_categorical_strings(self, extractor):
+        """Should intern category/complexity/concern so patterns share one string each"""
+        item = (
+            '{"source_pattern": "%s", "target_pattern": "new", "complexity": "low", '
+            '"category": "api", "concern": "web", "provider_type": "java", "rationale": "Test"}'
+        )
+        response = "[" + ", ".join(item % name for name in ("A", "B")) + "]"
+
+        first, second = extractor._parse_extraction_response(response)
+
+        assert first.category is second.category
+        assert first.complexity is second.complexity
+        assert first.concern is second.concern
+        assert first.provider_type is second.provider_type
+
     def test_parse_json_with_surrounding_text(self, extractor):
         """Should extract JSON from response with surrounding text"""
         response = '''Here are the patterns:
@@ -173,22 +262,6 @@ class TestPatternParsing:
         assert len(patterns) == 1
         assert patterns[0].source_pattern == "test.pattern"
 
-    def test_handle_invalid_json(self, extractor):
-        """Should return empty list for invalid JSON"""
-        response = "This is not valid JSON {invalid}"
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert patterns == []
-
-    def test_handle_no_json_array(self, extractor):
-        """Should return empty list when no JSON array found"""
-        response = "No JSON array here"
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert patterns == []
-
     def test_handle_missing_required_fields(self, extractor):
         """Should skip patterns with missing required fields"""
         response = '''[
@@ -205,23 +278,16 @@ class TestPatternParsing:
 
     def test_handle_invalid_location_type(self, extractor):
         """Should handle invalid location type gracefully"""
-        response = '''[{
-            "source_pattern": "test",
-            "target_pattern": "new",
-            "location_type": "INVALID_TYPE",
-            "complexity": "TRIVIAL",
-            "category": "api",
-            "rationale": "Test"
-        }]'''
+        response = pattern_response(location_type="INVALID_TYPE")
 
         patterns = extractor._parse_extraction_response(response)
 
         assert len(patterns) == 1
         assert patterns[0].location_type is None
 
-    def test_parse_pattern_with_all_location_types(self, extractor):
-        """Should correctly parse all valid location types"""
-        location_types = [
+    @pytest.mark.parametrize(
+        "loc_type",
+        [
             "ANNOTATION",
             "IMPORT",
             "METHOD_CALL",
@@ -229,62 +295,41 @@ class TestPatternParsing:
             "TYPE",
             "INHERITANCE",
             "PACKAGE",
-        ]
-
-        for loc_type in location_types:
-            response = f'''[{{
-                "source_pattern": "test",
-                "target_pattern": "new",
-                "location_type": "{loc_type}",
-                "complexity": "TRIVIAL",
-                "category": "api",
-                "rationale": "Test"
-            }}]'''
+        ],
+    )
+    def test_parse_pattern_with_all_location_types(self, extractor, loc_type):
+        """Should correctly parse all valid location types"""
+        response = pattern_response(location_type=loc_type)
 
-            patterns = extractor._parse_extraction_response(response)
+        patterns = extractor._parse_extraction_response(response)
 
-            assert len(patterns) == 1
-            assert patterns[0].location_type == LocationType(loc_type)
+        assert len(patterns) == 1
+        assert patterns[0].location_type == LocationType(loc_type)
 
-    def test_parse_pattern_with_csharp_location_types(self, extractor):
+    @pytest.mark.parametrize("loc_type", ["FIELD", "CLASS", "METHOD", "ALL"])
+    def test_parse_pattern_with_csharp_location_types(self, extractor, loc_type):
         """Should correctly parse all valid C# location types"""
-        location_types = ["FIELD", "CLASS", "METHOD", "ALL"]
-
-        for loc_type in location_types:
-            response = f'''[{{
-                "source_pattern": "test",
-                "target_pattern": "new",
-                "location_type": "{loc_type}",
-                "provider_type": "csharp",
-                "complexity": "TRIVIAL",
-                "category": "api",
-                "rationale": "Test"
-            }}]'''
+        response = pattern_response(location_type=loc_type, provider_type="csharp")
 
-            patterns = extractor._parse_extraction_response(response)
+        patterns = extractor._parse_extraction_response(response)
 
-            assert len(patterns) == 1
-            assert patterns[0].location_type == CSharpLocationType(loc_type)
-            assert patterns[0].provider_type == "csharp"
+        assert len(patterns) == 1
+        assert patterns[0].location_type == CSharpLocationType(loc_type)
+        assert patterns[0].provider_type == "csharp"
 
     def test_parse_pattern_with_optional_fields(self, extractor):
         """Should parse pattern with all optional fields"""
-        response = '''[{
-            "source_pattern": "old.pattern",
-            "target_pattern": "new.pattern",
-            "source_fqn": "com.example.OldClass",
-            "location_type": "TYPE",
-            "alternative_fqns": ["com.example.AlternativeClass"],
-            "complexity": "MEDIUM",
-            "category": "api",
-            "concern": "performance",
-            "provider_type": "java",
-            "file_pattern": "*.java",
-            "rationale": "Performance improvement",
-            "example_before": "OldClass obj = new OldClass();",
-            "example_after": "NewClass obj = new NewClass();",
-            "documentation_url": "https://example.com/docs"
-        }]'''
+        response = pattern_response(
+            source_fqn="com.example.OldClass",
+            location_type="TYPE",
+            alternative_fqns=["com.example.AlternativeClass"],
+            concern="performance",
+            provider_type="java",
+            file_pattern="*.java",
+            example_before="OldClass obj = new OldClass();",
+            example_after="NewClass obj = new NewClass();",
+            documentation_url="https://example.com/docs",
+        )
 
         patterns = extractor._parse_extraction_response(response)
 
@@ -299,13 +344,7 @@ class TestPatternParsing:
 
     def test_parse_pattern_with_missing_optional_fields(self, extractor):
         """Should handle missing optional fields with defaults"""
-        response = '''[{
-            "source_pattern": "test",
-            "target_pattern": "new",
-            "complexity": "TRIVIAL",
-            "category": "api",
-            "rationale": "Test"
-        }]'''
+        response = pattern_response()
 
         patterns = extractor._parse_extraction_response(response)
 
@@ -350,13 +389,6 @@ class TestPatternParsing:
 class TestOpenRewriteMode:
     """Test OpenRewrite-specific extraction behavior."""
 
-    @pytest.fixture
-    def mock_llm_provider(self):
-        """Create a mock LLM provider."""
-        mock = Mock()
-        mock.generate = Mock(return_value="[]")
-        return mock
-
     def test_openrewrite_mode_flag(self, mock_llm_provider):
         """Should set from_openrewrite flag correctly"""
         extractor = MigrationPatternExtractor(mock_llm_provider, from_openrewrite=True)
@@ -371,68 +403,24 @@ class TestOpenRewriteMode:
         assert extractor.from_openrewrite is False
 
 
-class TestPatternComplexity:
-    """Test handling of different complexity levels."""
-
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor instance."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
-
-    @pytest.mark.parametrize("complexity", ["TRIVIAL", "LOW", "MEDIUM", "HIGH", "EXPERT"])
-    def test_parse_all_complexity_levels(self, extractor, complexity):
-        """Should parse all valid complexity levels"""
-        response = f'''[{{
-            "source_pattern": "test",
-            "target_pattern": "new",
-            "complexity": "{complexity}",
-            "category": "api",
-            "rationale": "Test"
-        }}]'''
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert len(patterns) == 1
-        assert patterns[0].complexity == complexity
-
-
-class TestPatternCategories:
-    """Test handling of different pattern categories."""
-
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor instance."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
-
-    @pytest.mark.parametrize(
-        "category", ["dependency", "annotation", "api", "configuration", "other"]
-    )
-    def test_parse_all_categories(self, extractor, category):
-        """Should parse all valid categories"""
-        response = f'''[{{
-            "source_pattern": "test",
-            "target_pattern": "new",
-            "complexity": "TRIVIAL",
-            "category": "{category}",
-            "rationale": "Test"
-        }}]'''
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert len(patterns) == 1
-        assert patterns[0].category == category
-
-
 class TestErrorHandling:
     """Test error handling in pattern extraction."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor instance."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
+    @pytest.mark.parametrize(
+        "response",
+        [
+            pytest.param("This is not valid JSON {invalid}", id="invalid-json"),
+            pytest.param("No JSON array here", id="no-json-array"),
+            pytest.param("This is not JSON at all, just plain text", id="plain-text"),
+            pytest.param("See note] and the list [ that never closes", id="brackets-reversed"),
+            pytest.param('[{"source_pattern": "test", "complexity":', id="partial-json"),
+            pytest.param("[]", id="empty-array"),
+            pytest.param('{"source_pattern": "test"}', id="object-not-array"),
+        ],
+    )
+    def test_response_without_patterns_returns_empty(self, extractor, response):
+        """Should return an empty list when the response holds no usable JSON array"""
+        assert extractor._parse_extraction_response(response) == []
 
     def test_handle_pydantic_validation_error(self, extractor):
         """Should skip patterns with Pydantic validation errors"""
@@ -480,62 +468,6 @@ class TestErrorHandling:
         assert len(patterns) == 1
         assert patterns[0].source_pattern == "test1"
 
-    def test_handle_malformed_json_in_response(self, extractor):
-        """Should return empty list for completely malformed JSON"""
-        response = "This is not JSON at all, just plain text"
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert patterns == []
-
-    def test_handle_partial_json(self, extractor):
-        """Should return empty list for incomplete JSON"""
-        response = '''[{"source_pattern": "test", "complexity":'''
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert patterns == []
-
-    def test_handle_empty_json_array(self, extractor):
-        """Should handle empty JSON array"""
-        response = "[]"
-
-        patterns = extractor._parse_extraction_response(response)
-
-        assert patterns == []
-
-    def test_handle_non_array_json(self, extractor):
-        """Should return empty list when JSON is not an array"""
-        response = '''{"source_pattern": "test"}'''
-
-        patterns = extractor._parse_extraction_response(response)
-
-        # Should return empty since it's looking for an array
-        assert patterns == []
-
-    def test_extract_patterns_with_llm_error(self):
-        """Should return empty list when LLM raises exception"""
-        mock_llm = Mock()
-        mock_llm.generate.side_effect = Exception("LLM API error")
-
-        extractor = MigrationPatternExtractor(mock_llm)
-        patterns = extractor.extract_patterns("test guide")
-
-        assert patterns == []
-
-    def test_extract_patterns_with_llm_returning_invalid_json(self):
-        """Should handle LLM returning non-JSON response"""
-        mock_llm = Mock()
-        mock_llm.generate.return_value = {
-            "response": "I cannot extract patterns from this guide.",
-            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
-        }
-
-        extractor = MigrationPatternExtractor(mock_llm)
-        patterns = extractor.extract_patterns("invalid guide")
-
-        assert patterns == []
-
     def test_handle_json_with_extra_fields(self, extractor):
         """Should ignore extra fields in JSON"""
         response = '''[{
@@ -553,51 +485,126 @@ class TestErrorHandling:
         assert len(patterns) == 1
         assert patterns[0].source_pattern == "test"
 
-    def test_handle_null_values_in_optional_fields(self, extractor):
-        """Should handle explicit null values in optional fields"""
-        response = '''[{
-            "source_pattern": "test",
-            "target_pattern": null,
-            "source_fqn": null,
+    def test_handle_non_object_array_items(self, extractor):
+        """Should skip array items that are not JSON objects"""
+        response = '''["not a pattern", 42, {
+            "source_pattern": "valid",
+            "target_pattern": "new",
             "complexity": "MEDIUM",
             "category": "api",
-            "rationale": "Test"
+            "rationale": "Valid"
         }]'''
 
         patterns = extractor._parse_extraction_response(response)
 
         assert len(patterns) == 1
-        assert patterns[0].target_pattern is None
-        assert patterns[0].source_fqn is None
+        assert patterns[0].source_pattern == "valid"
 
-    def test_handle_type_mismatch_errors(self, extractor):
-        """Should handle patterns that have unexpected data types in fields"""
+    def test_handle_field_that_fails_model_validation(self, extractor):
+        """Should skip only the pattern whose field values fail model validation"""
         response = '''[
             {
-                "source_pattern": "test",
+                "source_pattern": "valid",
                 "target_pattern": "new",
                 "complexity": "MEDIUM",
                 "category": "api",
                 "rationale": "Valid"
+            },
+            {
+                "source_pattern": ["not", "a", "string"],
+                "target_pattern": "new",
+                "complexity": "MEDIUM",
+                "category": "api",
+                "rationale": "Invalid"
             }
         ]'''
 
         patterns = extractor._parse_extraction_response(response)
 
-        # Should successfully parse the valid pattern
         assert len(patterns) == 1
-        assert patterns[0].source_pattern == "test"
+        assert patterns[0].source_pattern == "valid"
+
+    def test_handle_json_rejected_by_strict_parser(self, extractor):
+        """Should accept JSON the stdlib parses even if a stricter parser rejects it"""
+        response = '''[{
+            "source_pattern": "test \\ud800",
+            "target_pattern": "new",
+            "complexity": "MEDIUM",
+            "category": "api",
+            "rationale": "Test"
+        }]'''
+
+        patterns = extractor._parse_extraction_response(response)
+
+        assert len(patterns) == 1
+        assert patterns[0].source_pattern == "test \ud800"
+
+    def test_handle_null_values_in_optional_fields(self, extractor):
+        """Should handle explicit null values in optional fields"""
+        response = pattern_response(target_pattern=None, source_fqn=None)
+
+        patterns = extractor._parse_extraction_response(response)
+
+        assert len(patterns) == 1
+        assert patterns[0].target_pattern is None
+        assert patterns[0].source_fqn is None
+
+    @pytest.mark.parametrize(
+        "mismatch",
+        [
+            pytest.param({"complexity": 123}, id="numeric-complexity"),
+            pytest.param({"source_pattern": 123}, id="numeric-source-pattern"),
+            pytest.param({"alternative_fqns": "com.example.Other"}, id="string-alternatives"),
+        ],
+    )
+    def test_handle_type_mismatch_errors(self, extractor, mismatch):
+        """Should skip patterns with unexpected data types and keep the valid ones"""
+        response = json.dumps(
+            [{**BASE_PATTERN, **mismatch}, {**BASE_PATTERN, "source_pattern": "valid"}]
+        )
+
+        patterns = extractor._parse_extraction_response(response)
+
+        # Only the well-typed pattern survives
+        assert [pattern.source_pattern for pattern in patterns] == ["valid"]
+
+
+class TestExtractionLLMFailures:
+    """Test extract_patterns when the LLM call fails or returns no JSON.
+
+    These tests configure the LLM per test, so they build their own provider stub
+    rather than using the module-scoped extractor shared by the parsing tests.
+    """
+
+    def test_extract_patterns_with_llm_error(self):
+        """Should return empty list when LLM raises exception"""
+
+        def generate(*args, **kwargs):
+            raise Exception("LLM API error")
+
+        extractor = MigrationPatternExtractor(SimpleNamespace(generate=generate))
+        patterns = extractor.extract_patterns("test guide")
+
+        assert patterns == []
+
+    def test_extract_patterns_with_llm_returning_invalid_json(self):
+        """Should handle LLM returning non-JSON response"""
+        response = {
+            "response": "I cannot extract patterns from this guide.",
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5},
+        }
+
+        extractor = MigrationPatternExtractor(
+            SimpleNamespace(generate=lambda *args, **kwargs: response)
+        )
+        patterns = extractor.extract_patterns("invalid guide")
+
+        assert patterns == []
 
 
 class TestJSONRepair:
     """Test JSON repair functionality."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor with mock LLM."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
-
     def test_repair_invalid_backslash_escapes(self, extractor):
         """Should not modify already-valid escape sequences to avoid breaking valid JSON"""
         # JSON that's actually valid (LLM generates correct double-backslash)
@@ -665,6 +672,23 @@ class TestJSONRepair:
         parsed = json.loads(repaired)
         assert len(parsed) == 2
 
+    def test_repair_escapes_invalid_backslash_in_strings(self, extractor):
+        """Should turn invalid escapes like \\s into a literal backslash"""
+        malformed = r'{"pattern": "\s+", "over_escaped": "\\\d+"}'
+        repaired = extractor._repair_json(malformed)
+
+        parsed = json.loads(repaired)
+        assert parsed["pattern"] == r"\s+"
+        assert parsed["over_escaped"] == r"\\d+"
+
+    def test_repair_leaves_string_contents_untouched(self, extractor):
+        """Should not apply structural fixes to brackets and commas inside strings"""
+        malformed = '[{"example": "style={{a,}}{b} [x] [y]",}]'
+        repaired = extractor._repair_json(malformed)
+
+        parsed = json.loads(repaired)
+        assert parsed[0]["example"] == "style={{a,}}{b} [x] [y]"
+
     def test_repair_handles_already_valid_json(self, extractor):
         """Should not break already valid JSON"""
         valid_json = '{"pattern": "example", "rationale": "Test"}'
@@ -674,16 +698,37 @@ class TestJSONRepair:
         assert parsed["pattern"] == "example"
         assert parsed["rationale"] == "Test"
 
+    def test_repair_large_response_is_fast(self, extractor):
+        """Should repair a large response at C speed rather than looping per character in Python"""
+        item = {
+            **BASE_PATTERN,
+            "source_fqn": "\\s+Button\\.isActive",
+            "example_before": '<Button isActive={true} variant="primary" />',
+        }
+        valid = json.dumps([item] * 300, indent=2)  # ~80 KB, like a large extraction response
+        malformed = valid.replace('"\n  }', '",\n  }')  # trailing comma in every object
+
+        repaired = extractor._repair_json(malformed)
+        repair_time = min(timeit.repeat(lambda: extractor._repair_json(malformed), number=3))
+        parse_time = min(timeit.repeat(lambda: json.loads(valid), number=3))
+
+        assert json.loads(repaired) == json.loads(valid)
+        # Regex passes run within a small factor of json.loads (about 1.5x, 4x under
+        # coverage); a per-character Python loop was 14x (55x under coverage)
+        assert repair_time < 10 * parse_time
+
+    def test_valid_response_skips_repair(self, extractor):
+        """Should only run the repair pass when the response fails to parse"""
+        with patch.object(extractor, "_repair_json") as mock_repair:
+            patterns = extractor._parse_extraction_response(pattern_response())
+
+        assert len(patterns) == 1
+        mock_repair.assert_not_called()
+
 
 class TestPatternValidation:
     """Test pattern validation helper functions."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor with mock LLM."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
-
     def test_looks_like_prop_pattern_with_component_prop_format(self, extractor):
         """Should detect patterns in 'Component propName' format"""
         pattern = MigrationPattern(
@@ -797,10 +842,9 @@ class TestOpenRewritePrompt:
     """Test OpenRewrite-specific prompt generation."""
 
     @pytest.fixture
-    def extractor(self):
+    def extractor(self, mock_llm_provider):
         """Create extractor configured for OpenRewrite."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm, from_openrewrite=True)
+        return MigrationPatternExtractor(mock_llm_provider, from_openrewrite=True)
 
     def test_build_openrewrite_prompt_for_java(self, extractor):
         """Should generate Java-specific OpenRewrite prompt"""
@@ -870,12 +914,6 @@ class TestOpenRewritePrompt:
 class TestAggressiveJSONRepair:
     """Test aggressive JSON repair fallback logic."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor with mock LLM."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
-
     def test_parse_response_with_badly_malformed_json(self, extractor):
         """Should use aggressive repair when initial repair fails"""
         # JSON that's so broken even initial repair won't fix it
@@ -924,35 +962,35 @@ class TestAggressiveJSONRepair:
 class TestChunkedExtraction:
     """Test chunked content extraction."""
 
-    @pytest.fixture
-    def extractor(self):
-        """Create extractor with mock LLM."""
-        mock_llm = Mock()
-        return MigrationPatternExtractor(mock_llm)
-
-    def test_extract_patterns_chunked_splits_large_content(self, extractor):
+    def test_extract_patterns_chunked_splits_large_content(self, extractor, monkeypatch):
         """Should split large content into chunks and process each"""
-        # Create large content that will be chunked
-        large_content = "Migration guide:\n" + ("Some content about API changes.\n" * 1000)
-
-        # Mock the single extraction to return patterns
-        with patch.object(extractor, '_extract_patterns_single') as mock_single:
-            mock_single.return_value = [
-                MigrationPattern(
-                    source_pattern="OldAPI", rationale="Test", complexity="low", category="api"
-                )
-            ]
-
-            patterns = extractor._extract_patterns_chunked(
-                large_content, source_framework="v1", target_framework="v2"
-            )
+        # Create content just over one chunk (chunker budgets ~4 chars per token)
+        line = "Some content about API changes.\n"
+        repeat = config.EXTRACTION_MAX_TOKENS * 4 // len(line) + 1
+        large_content = "Migration guide:\n" + (line * repeat)
+
+        pattern = MigrationPattern(
+            source_pattern="OldAPI", rationale="Test", complexity="low", category="api"
+        )
+        calls = []
+
+        def fake_single(*args, **kwargs):
+            calls.append(args)
+            return [pattern]
+
+        # Stub the single extraction to return patterns
+        monkeypatch.setattr(extractor, '_extract_patterns_single', fake_single)
 
-            # Should have called _extract_patterns_single at least once (probably multiple times for chunks)
-            assert mock_single.call_count >= 1
-            # Should return patterns
-            assert len(patterns) >= 1
+        patterns = extractor._extract_patterns_chunked(
+            large_content, source_framework="v1", target_framework="v2"
+        )
+
+        # Should have called _extract_patterns_single once per chunk
+        assert len(calls) >= 2
+        # Should return patterns
+        assert len(patterns) >= 1
 
-    def test_extract_patterns_chunked_deduplicates(self, extractor):
+    def test_extract_patterns_chunked_deduplicates(self, extractor, monkeypatch):
         """Should deduplicate patterns from different chunks"""
         content = "Test content"
 
@@ -966,48 +1004,24 @@ class TestChunkedExtraction:
             concern="api",
         )
 
-        with patch.object(extractor, '_extract_patterns_single') as mock_single:
-            # Return same pattern twice (simulating duplicates from different chunks)
-            mock_single.return_value = [duplicate_pattern, duplicate_pattern]
+        # Return same pattern twice (simulating duplicates from different chunks)
+        monkeypatch.setattr(
+            extractor,
+            '_extract_patterns_single',
+            lambda *args, **kwargs: [duplicate_pattern, duplicate_pattern],
+        )
 
-            patterns = extractor._extract_patterns_chunked(
-                content, source_framework="v1", target_framework="v2"
-            )
+        patterns = extractor._extract_patterns_chunked(
+            content, source_framework="v1", target_framework="v2"
+        )
 
-            # Should deduplicate based on source_fqn + concern
-            # Exact count depends on chunking, but should handle deduplication
-            assert isinstance(patterns, list)
+        # Should deduplicate based on source_fqn + concern
+        # Exact count depends on chunking, but should handle deduplication
+        assert isinstance(patterns, list)
 
     def test_deduplicate_patterns_removes_duplicates(self, extractor):
         """Should remove duplicate patterns based on source_fqn and concern"""
-        patterns = [
-            MigrationPattern(
-                source_pattern="test1",
-                source_fqn="com.example.Test",
-                concern="api",
-                rationale="First",
-                complexity="low",
-                category="api",
-            ),
-            MigrationPattern(
-                source_pattern="test2",
-                source_fqn="com.example.Test",  # Same FQN
-                concern="api",  # Same concern
-                rationale="Duplicate",
-                complexity="low",
-                category="api",
-            ),
-            MigrationPattern(
-                source_pattern="test3",
-                source_fqn="com.example.Other",  # Different FQN
-                concern="api",
-                rationale="Different",
-                complexity="low",
-                category="api",
-            ),
-        ]
-
-        unique = extractor._deduplicate_patterns(patterns)
+        unique = extractor._deduplicate_patterns(list(DEDUP_CASES["same_fqn"]))
 
         # Should keep only 2: one for Test (first occurrence) and one for Other
         assert len(unique) == 2
@@ -1016,26 +1030,75 @@ class TestChunkedExtraction:
 
     def test_deduplicate_patterns_keeps_different_concerns(self, extractor):
         """Should keep patterns with same FQN but different concerns"""
-        patterns = [
-            MigrationPattern(
-                source_pattern="test",
-                source_fqn="com.example.Test",
-                concern="api",
-                rationale="API concern",
-                complexity="low",
-                category="api",
-            ),
-            MigrationPattern(
-                source_pattern="test",
-                source_fqn="com.example.Test",  # Same FQN
-                concern="configuration",  # Different concern
-                rationale="Config concern",
-                complexity="low",
-                category="api",
-            ),
-        ]
-
-        unique = extractor._deduplicate_patterns(patterns)
+        unique = extractor._deduplicate_patterns(list(DEDUP_CASES["different_concern"]))
 
         # Should keep both (different concerns)
         assert len(unique) == 2
+
+
+class TestBatchExtraction:
+    """Test concurrent extraction from several guides."""
+
+    def test_batch_returns_results_in_guide_order(self):
+        """Should return one pattern list per guide, in input order"""
+        mock_llm = Mock()
+        mock_llm.generate.side_effect = lambda prompt: {
+            "response": pattern_response(
+                source_pattern="first" if "guide one" in prompt else "second"
+            )
+        }
+        extractor = MigrationPatternExtractor(mock_llm)
+
+        results = extractor.extract_patterns_batch(["guide one", "guide two"], max_concurrency=2)
+
+        assert [[p.source_pattern for p in patterns] for patterns in results] == [
+            ["first"],
+            ["second"],
+        ]
+        assert mock_llm.generate.call_count == 2
+
+    def test_batch_isolates_failing_guide(self):
+        """Should return an empty list for a guide whose LLM call fails"""
+
+        def generate(prompt):
+            if "broken guide" in prompt:
+                raise Exception("LLM API error")
+            return {"response": pattern_response(source_pattern="ok")}
+
+        extractor = MigrationPatternExtractor(SimpleNamespace(generate=generate))
+
+        results = extractor.extract_patterns_batch(["good guide", "broken guide", "other guide"])
+
+        assert len(results) == 3
+        assert results[1] == []
+        assert [p.source_pattern for p in results[0]] == ["ok"]
+        assert [p.source_pattern for p in results[2]] == ["ok"]
+
+    def test_batch_raises_authentication_errors(self):
+        """Should propagate authentication failures instead of skipping the guide"""
+
+        def generate(prompt):
+            raise LLMAuthenticationError("bad key")
+
+        extractor = MigrationPatternExtractor(SimpleNamespace(generate=generate))
+
+        with pytest.raises(LLMAuthenticationError):
+            extractor.extract_patterns_batch(["guide one", "guide two"])
+
+    def test_batch_with_no_guides(self):
+        """Should return an empty list without calling the LLM"""
+        mock_llm = Mock()
+        extractor = MigrationPatternExtractor(mock_llm)
+
+        assert extractor.extract_patterns_batch([]) == []
+        mock_llm.generate.assert_not_called()
+
+    @pytest.mark.parametrize("max_concurrency", [0, -1])
+    def test_batch_rejects_non_positive_concurrency(self, max_concurrency):
+        """Should reject a concurrency limit below 1 instead of falling back to the default"""
+        mock_llm = Mock()
+        extractor = MigrationPatternExtractor(mock_llm)
+
+        with pytest.raises(ValueError, match="max_concurrency"):
+            extractor.extract_patterns_batch(["guide one"], max_concurrency=max_concurrency)
+        mock_llm.generate.assert_not_called()
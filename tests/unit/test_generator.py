@@ -18,10 +18,33 @@ from src.rule_generator.schema import (
     AnalyzerRule,
     Category,
     CSharpLocationType,
+    Link,
     LocationType,
     MigrationPattern,
 )
 
+# Builtin PatternFly chart import migration, shared by the import-pattern tests (never mutated)
+CHART_IMPORT_PATTERN = MigrationPattern(
+    source_pattern="import { Area } from '@patternfly/react-charts'",
+    target_pattern="import { Area } from '@patternfly/react-charts/victory'",
+    source_fqn="import.*from '@patternfly/react-charts'",
+    provider_type="builtin",
+    file_pattern="\\.(j|t)sx?$",
+    complexity="LOW",
+    category="api",
+    rationale="Victory-based charts have moved to a 'victory' directory",
+)
+
+
+# Rationale long enough to exercise message building on large inputs
+LONG_RATIONALE = "This is a very long rationale. " * 100
+
+
+@pytest.fixture(scope="module")
+def generator():
+    """Framework-less generator shared by tests that do not depend on rule ID numbering."""
+    return AnalyzerRuleGenerator()
+
 
 class TestRuleIDGeneration:
     """Test rule ID generation logic."""
@@ -32,13 +55,13 @@ class TestRuleIDGeneration:
             source_framework="spring-boot-3", target_framework="spring-boot-4"
         )
 
-        id1 = generator._create_rule_id()
-        id2 = generator._create_rule_id()
-        id3 = generator._create_rule_id()
+        rule_ids = [generator._create_rule_id() for _ in range(3)]
 
-        assert id1 == "spring-boot-3-to-spring-boot-4-00000"
-        assert id2 == "spring-boot-3-to-spring-boot-4-00010"
-        assert id3 == "spring-boot-3-to-spring-boot-4-00020"
+        assert rule_ids == [
+            "spring-boot-3-to-spring-boot-4-00000",
+            "spring-boot-3-to-spring-boot-4-00010",
+            "spring-boot-3-to-spring-boot-4-00020",
+        ]
 
     def test_generate_rule_id_with_rule_file_name(self):
         """Should use rule_file_name if provided"""
@@ -56,352 +79,240 @@ class TestRuleIDGeneration:
 
         assert rule_id == "migration-00000"
 
+    def test_rule_id_follows_reassigned_rule_file_name(self):
+        """Should pick up rule_file_name changes made after construction"""
+        generator = AnalyzerRuleGenerator(source_framework="a", target_framework="b")
+
+        first_id = generator._create_rule_id()
+        generator.rule_file_name = "custom-rules"
+        second_id = generator._create_rule_id()
+
+        assert [first_id, second_id] == ["a-to-b-00000", "custom-rules-00010"]
+
     def test_rule_id_has_five_digits(self):
         """Should always use 5-digit numbering"""
         generator = AnalyzerRuleGenerator(source_framework="a", target_framework="b")
 
-        # Generate many IDs to test padding
-        for i in range(15):
-            rule_id = generator._create_rule_id()
+        # Start as if 14 IDs had already been generated
+        generator._rule_counter = 14
+        rule_id = generator._create_rule_id()
 
-        # Last ID should still have 5 digits
+        # The 15th ID should still have 5 digits
         assert rule_id.endswith("-00140")
 
 
 class TestComplexityToEffortMapping:
     """Test complexity to effort score mapping."""
 
-    def test_map_trivial_to_effort_1(self):
-        """Should map TRIVIAL to effort 1"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("TRIVIAL")
-        assert effort == 1
-
-    def test_map_low_to_effort_3(self):
-        """Should map LOW to effort 3"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("LOW")
-        assert effort == 3
-
-    def test_map_medium_to_effort_5(self):
-        """Should map MEDIUM to effort 5"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("MEDIUM")
-        assert effort == 5
-
-    def test_map_high_to_effort_7(self):
-        """Should map HIGH to effort 7"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("HIGH")
-        assert effort == 7
-
-    def test_map_expert_to_effort_10(self):
-        """Should map EXPERT to effort 10"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("EXPERT")
-        assert effort == 10
-
-    def test_map_unknown_to_default_5(self):
-        """Should default to effort 5 for unknown complexity"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("UNKNOWN")
-        assert effort == 5
-
-    def test_map_case_insensitive(self):
-        """Should handle lowercase complexity values"""
-        generator = AnalyzerRuleGenerator()
-        effort = generator._map_complexity_to_effort("trivial")
-        assert effort == 1
+    @pytest.mark.parametrize(
+        "complexity, expected",
+        [
+            pytest.param("TRIVIAL", 1, id="trivial"),
+            pytest.param("LOW", 3, id="low"),
+            pytest.param("MEDIUM", 5, id="medium"),
+            pytest.param("HIGH", 7, id="high"),
+            pytest.param("EXPERT", 10, id="expert"),
+            pytest.param("UNKNOWN", 5, id="unknown-defaults-to-5"),
+            pytest.param("trivial", 1, id="case-insensitive"),
+        ],
+    )
+    def test_map_complexity_to_effort(self, generator, complexity, expected):
+        """Should map each complexity level to its effort score"""
+        assert generator._map_complexity_to_effort(complexity) == expected
 
 
 class TestCategoryDetermination:
     """Test category determination logic."""
 
-    def test_high_complexity_is_mandatory(self):
-        """Should categorize HIGH complexity as mandatory"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test", complexity="HIGH", category="api", rationale="Test change"
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.MANDATORY
-
-    def test_expert_complexity_is_mandatory(self):
-        """Should categorize EXPERT complexity as mandatory"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test",
-            complexity="EXPERT",
-            category="api",
-            rationale="Complex migration",
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.MANDATORY
-
-    def test_trivial_complexity_is_mandatory(self):
-        """Should categorize TRIVIAL complexity as mandatory (easy wins)"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test", complexity="TRIVIAL", category="api", rationale="Simple rename"
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.MANDATORY
-
-    def test_removed_api_is_mandatory(self):
-        """Should categorize removed APIs as mandatory"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test",
-            complexity="MEDIUM",
-            category="api",
-            rationale="API has been removed in version 2",
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.MANDATORY
-
-    def test_deprecated_for_removal_is_mandatory(self):
-        """Should categorize deprecated for removal as mandatory"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Deprecated for removal in next release",
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.MANDATORY
-
-    def test_property_rename_is_mandatory(self):
-        """Should categorize property renames as mandatory"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="app.config.oldProperty",
-            target_pattern="app.config.newProperty",
-            complexity="MEDIUM",
-            category="configuration",
-            rationale="Property has been renamed",
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.MANDATORY
-
-    def test_medium_complexity_default_is_potential(self):
-        """Should categorize MEDIUM complexity as potential by default"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test", complexity="MEDIUM", category="api", rationale="General change"
-        )
-
-        category = generator._determine_category(pattern)
-        assert category == Category.POTENTIAL
-
-    def test_low_complexity_is_potential(self):
-        """Should categorize LOW complexity as potential"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test",
-            complexity="LOW",
+    @pytest.mark.parametrize(
+        "source_pattern, target_pattern, complexity, rationale, expected",
+        [
+            pytest.param("test", None, "HIGH", "Test change", Category.MANDATORY, id="high"),
+            pytest.param(
+                "test", None, "EXPERT", "Complex migration", Category.MANDATORY, id="expert"
+            ),
+            # Trivial changes are easy wins
+            pytest.param(
+                "test", None, "TRIVIAL", "Simple rename", Category.MANDATORY, id="trivial"
+            ),
+            pytest.param(
+                "test",
+                None,
+                "MEDIUM",
+                "API has been removed in version 2",
+                Category.MANDATORY,
+                id="removed-api",
+            ),
+            pytest.param(
+                "test",
+                None,
+                "MEDIUM",
+                "Deprecated for removal in next release",
+                Category.MANDATORY,
+                id="deprecated-for-removal",
+            ),
+            pytest.param(
+                "app.config.oldProperty",
+                "app.config.newProperty",
+                "MEDIUM",
+                "Property has been renamed",
+                Category.MANDATORY,
+                id="property-rename",
+            ),
+            pytest.param(
+                "test", None, "MEDIUM", "General change", Category.POTENTIAL, id="medium-default"
+            ),
+            pytest.param("test", None, "LOW", "Optional improvement", Category.POTENTIAL, id="low"),
+        ],
+    )
+    def test_determine_category(
+        self, generator, source_pattern, target_pattern, complexity, rationale, expected
+    ):
+        """Should categorize patterns by complexity and rationale keywords"""
+        pattern = MigrationPattern(
+            source_pattern=source_pattern,
+            target_pattern=target_pattern,
+            complexity=complexity,
             category="api",
-            rationale="Optional improvement",
+            rationale=rationale,
         )
 
-        category = generator._determine_category(pattern)
-        assert category == Category.POTENTIAL
+        assert generator._determine_category(pattern) == expected
 
 
 class TestWhenConditionBuilding:
     """Test when condition building for different providers."""
 
-    def test_build_java_referenced_condition(self):
-        """Should build java.referenced condition"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="OldClass",
-            source_fqn="com.example.OldClass",
-            location_type=LocationType.TYPE,
-            complexity="MEDIUM",
-            category="api",
-            rationale="Test",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        assert "java.referenced" in condition
-        assert condition["java.referenced"]["pattern"] == "com.example.OldClass"
-        assert condition["java.referenced"]["location"] == "TYPE"
-
-    def test_build_java_condition_with_default_location(self):
-        """Should default to TYPE location if not specified"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="OldClass",
-            source_fqn="com.example.OldClass",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Test",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        assert condition["java.referenced"]["location"] == "TYPE"
-
-    def test_build_java_condition_with_alternatives(self):
-        """Should build OR condition with alternative FQNs"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="javax.security.cert.*",
-            source_fqn="javax.security.cert.*",
-            alternative_fqns=["java.security.cert.*"],
-            location_type=LocationType.TYPE,
-            complexity="MEDIUM",
-            category="api",
-            rationale="Package migration",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        assert "or" in condition
-        assert len(condition["or"]) == 2
-        assert condition["or"][0]["java.referenced"]["pattern"] == "javax.security.cert.*"
-        assert condition["or"][1]["java.referenced"]["pattern"] == "java.security.cert.*"
-
-    def test_build_builtin_filecontent_condition(self):
-        """Should build builtin.filecontent condition"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="isDisabled",
-            source_fqn="isDisabled\\s*=",  # regex pattern
-            file_pattern="*.{tsx,jsx}",
-            provider_type="builtin",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Property rename",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        assert "builtin.filecontent" in condition
-        assert condition["builtin.filecontent"]["pattern"] == "isDisabled\\s*="
-        assert condition["builtin.filecontent"]["filePattern"] == "*.{tsx,jsx}"
-
-    def test_build_builtin_condition_without_file_pattern(self):
-        """Should build builtin condition without filePattern if not specified"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="oldPattern",
-            source_fqn="oldPattern",
-            provider_type="builtin",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Test",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        assert "builtin.filecontent" in condition
-        assert "filePattern" not in condition["builtin.filecontent"]
-
-    def test_build_nodejs_referenced_condition(self):
-        """Should build nodejs.referenced condition"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="OldComponent",
-            source_fqn="OldComponent",
-            provider_type="nodejs",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Component renamed",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        assert "nodejs.referenced" in condition
-        assert condition["nodejs.referenced"]["pattern"] == "OldComponent"
-
-    def test_build_nodejs_condition_uses_source_pattern_fallback(self):
-        """Should use source_pattern if source_fqn not available"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="oldFunction",
-            provider_type="nodejs",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Function renamed",
-        )
-
-        condition = generator._build_when_condition(pattern)
-
-        # When source_fqn is None, it uses source_pattern as fallback
-        assert condition is not None
-        assert "nodejs.referenced" in condition
-        assert condition["nodejs.referenced"]["pattern"] == "oldFunction"
-
-    def test_build_condition_returns_none_without_fqn(self):
-        """Should return None if no source_fqn or pattern"""
-        generator = AnalyzerRuleGenerator()
-        pattern = MigrationPattern(
-            source_pattern="test", complexity="MEDIUM", category="api", rationale="No FQN specified"
-        )
-
-        condition = generator._build_when_condition(pattern)
+    @pytest.mark.parametrize(
+        "fields, expected",
+        [
+            pytest.param(
+                {
+                    "source_pattern": "OldClass",
+                    "source_fqn": "com.example.OldClass",
+                    "location_type": LocationType.TYPE,
+                },
+                {"java.referenced": {"pattern": "com.example.OldClass", "location": "TYPE"}},
+                id="java-referenced",
+            ),
+            # Location defaults to TYPE when not specified
+            pytest.param(
+                {"source_pattern": "OldClass", "source_fqn": "com.example.OldClass"},
+                {"java.referenced": {"pattern": "com.example.OldClass", "location": "TYPE"}},
+                id="java-default-location",
+            ),
+            # Alternative FQNs produce an OR condition
+            pytest.param(
+                {
+                    "source_pattern": "javax.security.cert.*",
+                    "source_fqn": "javax.security.cert.*",
+                    "alternative_fqns": ["java.security.cert.*"],
+                    "location_type": LocationType.TYPE,
+                },
+                {
+                    "or": [
+                        {
+                            "java.referenced": {
+                                "pattern": "javax.security.cert.*",
+                                "location": "TYPE",
+                            }
+                        },
+                        {
+                            "java.referenced": {
+                                "pattern": "java.security.cert.*",
+                                "location": "TYPE",
+                            }
+                        },
+                    ]
+                },
+                id="java-alternatives",
+            ),
+            pytest.param(
+                {
+                    "source_pattern": "isDisabled",
+                    "source_fqn": "isDisabled\\s*=",  # regex pattern
+                    "file_pattern": "*.{tsx,jsx}",
+                    "provider_type": "builtin",
+                },
+                {
+                    "builtin.filecontent": {
+                        "pattern": "isDisabled\\s*=",
+                        "filePattern": "*.{tsx,jsx}",
+                    }
+                },
+                id="builtin-filecontent",
+            ),
+            pytest.param(
+                {
+                    "source_pattern": "oldPattern",
+                    "source_fqn": "oldPattern",
+                    "provider_type": "builtin",
+                },
+                {"builtin.filecontent": {"pattern": "oldPattern"}},
+                id="builtin-without-file-pattern",
+            ),
+            pytest.param(
+                {
+                    "source_pattern": "OldComponent",
+                    "source_fqn": "OldComponent",
+                    "provider_type": "nodejs",
+                },
+                {"nodejs.referenced": {"pattern": "OldComponent"}},
+                id="nodejs-referenced",
+            ),
+            # When source_fqn is None, nodejs uses source_pattern as fallback
+            pytest.param(
+                {"source_pattern": "oldFunction", "provider_type": "nodejs"},
+                {"nodejs.referenced": {"pattern": "oldFunction"}},
+                id="nodejs-source-pattern-fallback",
+            ),
+            # The default java provider needs source_fqn; source_pattern alone is not enough
+            pytest.param({"source_pattern": "test"}, None, id="java-without-fqn"),
+        ],
+    )
+    def test_build_when_condition(self, generator, fields, expected):
+        """Should build the provider-specific when condition for a pattern"""
+        pattern = MigrationPattern(complexity="MEDIUM", category="api", rationale="Test", **fields)
 
-        # For java provider (default), it needs source_fqn
-        # Since we only have source_pattern, it should return None
-        assert condition is None
+        assert generator._build_when_condition(pattern) == expected
 
 
 class TestLabelBuilding:
     """Test label generation."""
 
-    def test_build_labels_with_both_frameworks(self):
-        """Should build labels with source and target"""
-        generator = AnalyzerRuleGenerator(
-            source_framework="spring-boot-3", target_framework="spring-boot-4"
-        )
-
-        labels = generator._build_labels()
-
-        assert "konveyor.io/source=spring-boot-3" in labels
-        assert "konveyor.io/target=spring-boot-4" in labels
-
-    def test_build_labels_with_only_source(self):
-        """Should build label with only source"""
-        generator = AnalyzerRuleGenerator(source_framework="jakarta-ee-8")
-
-        labels = generator._build_labels()
-
-        assert "konveyor.io/source=jakarta-ee-8" in labels
-        assert len([label for label in labels if "target" in label]) == 0
-
-    def test_build_labels_with_only_target(self):
-        """Should build label with only target"""
-        generator = AnalyzerRuleGenerator(target_framework="jakarta-ee-10")
-
-        labels = generator._build_labels()
-
-        assert "konveyor.io/target=jakarta-ee-10" in labels
-        assert len([label for label in labels if "source" in label]) == 0
-
-    def test_build_empty_labels(self):
-        """Should build empty labels list without frameworks"""
-        generator = AnalyzerRuleGenerator()
+    @pytest.mark.parametrize(
+        "source, target, expected",
+        [
+            pytest.param(
+                "spring-boot-3",
+                "spring-boot-4",
+                {"konveyor.io/source=spring-boot-3", "konveyor.io/target=spring-boot-4"},
+                id="both-frameworks",
+            ),
+            pytest.param(
+                "jakarta-ee-8", None, {"konveyor.io/source=jakarta-ee-8"}, id="only-source"
+            ),
+            pytest.param(
+                None, "jakarta-ee-10", {"konveyor.io/target=jakarta-ee-10"}, id="only-target"
+            ),
+            pytest.param(None, None, set(), id="no-frameworks"),
+        ],
+    )
+    def test_build_labels(self, source, target, expected):
+        """Should build one label per configured framework and nothing else"""
+        generator = AnalyzerRuleGenerator(source_framework=source, target_framework=target)
 
         labels = generator._build_labels()
 
-        assert labels == []
+        assert len(labels) == len(expected)
+        assert set(labels) == expected
 
 
 class TestMessageBuilding:
     """Test migration message generation."""
 
-    def test_build_message_with_replacement(self):
+    def test_build_message_with_replacement(self, generator):
         """Should build message with replacement guidance"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="OldClass",
             target_pattern="NewClass",
@@ -415,9 +326,8 @@ class TestMessageBuilding:
         assert "Class has been renamed for clarity" in message
         assert "Replace `OldClass` with `NewClass`" in message
 
-    def test_build_message_for_removed_api(self):
+    def test_build_message_for_removed_api(self, generator):
         """Should build message for removed API without replacement"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="RemovedAPI",
             complexity="HIGH",
@@ -429,11 +339,9 @@ class TestMessageBuilding:
 
         assert "API has been removed" in message
         assert "Remove usage of `RemovedAPI`" in message
-        assert "API has been removed" in message
 
-    def test_build_message_with_examples(self):
+    def test_build_message_with_examples(self, generator):
         """Should include before/after examples in message"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="oldMethod()",
             target_pattern="newMethod()",
@@ -451,9 +359,8 @@ class TestMessageBuilding:
         assert "After:" in message
         assert "obj.newMethod();" in message
 
-    def test_build_message_without_examples(self):
+    def test_build_message_without_examples(self, generator):
         """Should build message without examples if not provided"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="OldClass",
             target_pattern="NewClass",
@@ -489,9 +396,8 @@ class TestLinksBuilding:
         assert links[0].url == "https://docs.spring.io/migration"
         assert "spring-boot-4" in links[0].title
 
-    def test_build_links_without_documentation_url(self):
+    def test_build_links_without_documentation_url(self, generator):
         """Should return None when no documentation URL"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="test", complexity="MEDIUM", category="api", rationale="Test"
         )
@@ -685,107 +591,86 @@ class TestGenerateRules:
         assert "Valid" in rules[0].message
 
 
+@pytest.fixture(scope="module")
+def rules_by_concern():
+    """Rules generated once from patterns spread over several concerns (tests only read them)."""
+    generator = AnalyzerRuleGenerator(source_framework="a", target_framework="b")
+    patterns = [
+        MigrationPattern(
+            source_pattern="Security1",
+            source_fqn="com.example.Security1",
+            complexity="MEDIUM",
+            category="api",
+            concern="security",
+            rationale="Security change 1",
+        ),
+        MigrationPattern(
+            source_pattern="Config1",
+            source_fqn="com.example.Config1",
+            complexity="MEDIUM",
+            category="configuration",
+            concern="configuration",
+            rationale="Config change",
+        ),
+        MigrationPattern(
+            source_pattern="Security2",
+            source_fqn="com.example.Security2",
+            complexity="MEDIUM",
+            category="api",
+            concern="security",
+            rationale="Security change 2",
+        ),
+        MigrationPattern(
+            source_pattern="Test",
+            source_fqn="com.example.Test",
+            complexity="MEDIUM",
+            category="api",
+            rationale="No concern specified",
+        ),
+        MigrationPattern(
+            source_pattern="",  # Empty pattern will be skipped
+            complexity="MEDIUM",
+            category="api",
+            concern="skipped",
+            rationale="Invalid - no FQN",
+        ),
+    ]
+
+    return generator.generate_rules_by_concern(patterns)
+
+
 class TestGenerateRulesByConcern:
     """Test rules generation grouped by concern."""
 
-    def test_group_rules_by_concern(self):
+    def test_group_rules_by_concern(self, rules_by_concern):
         """Should group rules by concern"""
-        generator = AnalyzerRuleGenerator()
-
-        patterns = [
-            MigrationPattern(
-                source_pattern="Security1",
-                source_fqn="com.example.Security1",
-                complexity="MEDIUM",
-                category="api",
-                concern="security",
-                rationale="Security change 1",
-            ),
-            MigrationPattern(
-                source_pattern="Security2",
-                source_fqn="com.example.Security2",
-                complexity="MEDIUM",
-                category="api",
-                concern="security",
-                rationale="Security change 2",
-            ),
-            MigrationPattern(
-                source_pattern="Config1",
-                source_fqn="com.example.Config1",
-                complexity="MEDIUM",
-                category="configuration",
-                concern="configuration",
-                rationale="Config change",
-            ),
+        assert [rule.ruleID for rule in rules_by_concern["security"]] == [
+            "a-to-b-00000",
+            "a-to-b-00010",
         ]
-
-        rules_by_concern = generator.generate_rules_by_concern(patterns)
-
-        assert "security" in rules_by_concern
-        assert "configuration" in rules_by_concern
-        assert len(rules_by_concern["security"]) == 2
         assert len(rules_by_concern["configuration"]) == 1
 
-    def test_use_general_for_no_concern(self):
+    def test_use_general_for_no_concern(self, rules_by_concern):
         """Should use 'general' for patterns without concern"""
-        generator = AnalyzerRuleGenerator()
-
-        patterns = [
-            MigrationPattern(
-                source_pattern="Test",
-                source_fqn="com.example.Test",
-                complexity="MEDIUM",
-                category="api",
-                rationale="No concern specified",
-            )
-        ]
-
-        rules_by_concern = generator.generate_rules_by_concern(patterns)
-
-        assert "general" in rules_by_concern
         assert len(rules_by_concern["general"]) == 1
 
-    def test_reset_rule_counter_per_concern(self):
-        """Should NOT reset rule counter per concern - IDs must be globally unique"""
-        generator = AnalyzerRuleGenerator(source_framework="a", target_framework="b")
+    def test_omit_concern_without_rules(self, rules_by_concern):
+        """Should leave out concerns whose patterns all fail to convert"""
+        assert set(rules_by_concern) == {"security", "configuration", "general"}
 
-        patterns = [
-            MigrationPattern(
-                source_pattern="Test1",
-                source_fqn="com.example.Test1",
-                complexity="MEDIUM",
-                category="api",
-                concern="concern-a",
-                rationale="Test",
-            ),
-            MigrationPattern(
-                source_pattern="Test2",
-                source_fqn="com.example.Test2",
-                complexity="MEDIUM",
-                category="api",
-                concern="concern-a",
-                rationale="Test",
-            ),
-            MigrationPattern(
-                source_pattern="Test3",
-                source_fqn="com.example.Test3",
-                complexity="MEDIUM",
-                category="api",
-                concern="concern-b",
-                rationale="Test",
-            ),
-        ]
-
-        rules_by_concern = generator.generate_rules_by_concern(patterns)
-
-        # First concern should have rules 00000 and 00010
-        concern_a_rules = rules_by_concern["concern-a"]
-        assert concern_a_rules[0].ruleID.endswith("-00000")
-        assert concern_a_rules[1].ruleID.endswith("-00010")
+    def test_reset_rule_counter_per_concern(self, rules_by_concern):
+        """Should NOT reset rule counter per concern - IDs must be globally unique"""
+        rule_numbers = {
+            concern: [rule.ruleID[-5:] for rule in rules]
+            for concern, rules in rules_by_concern.items()
+        }
 
-        # Second concern should continue with 00020 (counter does NOT reset)
-        concern_b_rules = rules_by_concern["concern-b"]
-        assert concern_b_rules[0].ruleID.endswith("-00020")
+        # Each concern continues numbering where the previous one stopped
+        assert rule_numbers == {
+            "security": ["00000", "00010"],
+            "configuration": ["00020"],
+            "general": ["00030"],
+        }
 
 
 class TestEdgeCases:
@@ -861,10 +746,8 @@ class TestEdgeCases:
 class TestGeneratorErrorHandling:
     """Test error handling in rule generation."""
 
-    def test_builtin_provider_without_source_fqn(self):
+    def test_builtin_provider_without_source_fqn(self, generator):
         """Should handle builtin provider when source_fqn is missing"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="test",
             provider_type="builtin",
@@ -881,13 +764,12 @@ class TestGeneratorErrorHandling:
         """Should handle very large rule numbers"""
         generator = AnalyzerRuleGenerator(source_framework="test", target_framework="test")
 
-        # Generate many rules to test large numbers
-        for i in range(100):
-            rule_id = generator._create_rule_id()
+        # Start as if 99 rules had already been generated
+        generator._rule_counter = 99
+        rule_id = generator._create_rule_id()
 
-        # Should still format correctly with 5 digits
-        assert rule_id.endswith("-00990")
-        assert len(rule_id.split("-")[-1]) == 5
+        # The 100th ID should still format correctly with 5 digits
+        assert rule_id == "test-to-test-00990"
 
     def test_pattern_with_empty_source_pattern(self):
         """Should skip patterns with empty source_pattern"""
@@ -930,10 +812,8 @@ class TestGeneratorErrorHandling:
         # Should sanitize special characters
         assert "@" in rule_id or rule_id.startswith("spring-boot")
 
-    def test_generate_rules_with_empty_list(self):
+    def test_generate_rules_with_empty_list(self, generator):
         """Should handle empty pattern list"""
-        generator = AnalyzerRuleGenerator()
-
         rules = generator.generate_rules([])
 
         assert rules == []
@@ -968,28 +848,8 @@ class TestGeneratorErrorHandling:
         # At least one rule should be generated
         assert len(rules_by_concern) > 0
 
-    def test_pattern_with_invalid_complexity(self):
-        """Should handle patterns with non-standard complexity values"""
-        generator = AnalyzerRuleGenerator()
-
-        pattern = MigrationPattern(
-            source_pattern="Test",
-            source_fqn="com.example.Test",
-            complexity="UNKNOWN_LEVEL",
-            category="api",
-            rationale="Test",
-        )
-
-        rule = generator._pattern_to_rule(pattern)
-
-        # Should still generate rule and map to default effort
-        assert rule is not None
-        assert rule.effort == 5  # Default for unknown
-
-    def test_builtin_provider_with_regex_special_chars(self):
+    def test_builtin_provider_with_regex_special_chars(self, generator):
         """Should handle builtin patterns with regex special characters"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="test.*[a-z]+",
             source_fqn="test\\.\\*\\[a-z\\]\\+",
@@ -1005,10 +865,8 @@ class TestGeneratorErrorHandling:
         assert condition is not None
         assert "builtin.filecontent" in condition
 
-    def test_alternative_fqns_with_empty_list(self):
+    def test_alternative_fqns_with_empty_list(self, generator):
         """Should handle empty alternative_fqns list"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="Test",
             source_fqn="com.example.Test",
@@ -1020,67 +878,55 @@ class TestGeneratorErrorHandling:
 
         condition = generator._build_when_condition(pattern)
 
-        # Should not create OR condition
-        assert "or" not in condition
-        assert "java.referenced" in condition
-
-    def test_pattern_with_very_long_message(self):
-        """Should handle patterns with very long rationale"""
-        generator = AnalyzerRuleGenerator()
-
-        long_rationale = "This is a very long rationale. " * 100
-
-        pattern = MigrationPattern(
-            source_pattern="Test",
-            target_pattern="New",
-            source_fqn="com.example.Test",
-            complexity="MEDIUM",
-            category="api",
-            rationale=long_rationale,
-        )
-
-        rule = generator._pattern_to_rule(pattern)
-
-        assert rule is not None
-        assert long_rationale in rule.message
-
-    def test_pattern_with_unicode_in_patterns(self):
-        """Should handle Unicode characters in patterns"""
-        generator = AnalyzerRuleGenerator()
-
-        pattern = MigrationPattern(
-            source_pattern="测试类",
-            target_pattern="TestClass",
-            source_fqn="com.测试.测试类",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Internationalization",
-        )
-
-        rule = generator._pattern_to_rule(pattern)
-
-        assert rule is not None
-        assert "测试类" in rule.message
-
-    def test_links_with_invalid_url(self):
-        """Should handle patterns with malformed documentation URLs"""
-        generator = AnalyzerRuleGenerator(target_framework="test")
-
-        pattern = MigrationPattern(
-            source_pattern="Test",
-            source_fqn="com.example.Test",
-            complexity="MEDIUM",
-            category="api",
-            rationale="Test",
-            documentation_url="not-a-valid-url",
-        )
-
-        rule = generator._pattern_to_rule(pattern)
+        # Should produce a single java.referenced condition rather than an OR
+        assert condition == {"java.referenced": {"pattern": "com.example.Test", "location": "TYPE"}}
+
+    @pytest.mark.parametrize(
+        "overrides, attribute, expected",
+        [
+            # Non-standard complexity maps to the default effort
+            pytest.param({"complexity": "UNKNOWN_LEVEL"}, "effort", 5, id="unknown-complexity"),
+            pytest.param(
+                {"target_pattern": "New", "rationale": LONG_RATIONALE},
+                "message",
+                f"{LONG_RATIONALE}\n\nReplace `Test` with `New`.",
+                id="very-long-rationale",
+            ),
+            pytest.param(
+                {
+                    "source_pattern": "测试类",
+                    "target_pattern": "TestClass",
+                    "source_fqn": "com.测试.测试类",
+                    "rationale": "Internationalization",
+                },
+                "message",
+                "Internationalization\n\nReplace `测试类` with `TestClass`.",
+                id="unicode-patterns",
+            ),
+            # Malformed documentation URLs are passed through as-is
+            pytest.param(
+                {"documentation_url": "not-a-valid-url"},
+                "links",
+                [Link(url="not-a-valid-url", title="Migration Documentation")],
+                id="invalid-documentation-url",
+            ),
+        ],
+    )
+    def test_pattern_to_rule_edge_cases(self, generator, overrides, attribute, expected):
+        """Should still generate a rule for unusual but valid pattern values"""
+        fields = {
+            "source_pattern": "Test",
+            "source_fqn": "com.example.Test",
+            "complexity": "MEDIUM",
+            "category": "api",
+            "rationale": "Test",
+            **overrides,
+        }
+
+        rule = generator._pattern_to_rule(MigrationPattern(**fields))
 
-        # Should still generate rule with the URL as-is
         assert rule is not None
-        if rule.links:
-            assert rule.links[0].url == "not-a-valid-url"
+        assert getattr(rule, attribute) == expected
 
 
 class TestNodejsReferencedRules:
@@ -1107,10 +953,8 @@ class TestNodejsReferencedRules:
         assert condition["nodejs.referenced"]["pattern"] == "Chip"
         assert "and" not in condition
 
-    def test_build_nodejs_condition_for_hook(self):
+    def test_build_nodejs_condition_for_hook(self, generator):
         """Should build simple nodejs.referenced condition for hooks"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="useHook",
             source_fqn="useHook",
@@ -1127,9 +971,8 @@ class TestNodejsReferencedRules:
         assert condition["nodejs.referenced"]["pattern"] == "useHook"
         assert "and" not in condition
 
-    def test_build_csharp_referenced_condition(self):
+    def test_build_csharp_referenced_condition(self, generator):
         """Should build c-sharp.referenced condition"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="HttpNotFound",
             source_fqn="System.Web.Mvc.HttpNotFound",
@@ -1146,9 +989,8 @@ class TestNodejsReferencedRules:
         assert condition["c-sharp.referenced"]["pattern"] == "System.Web.Mvc.HttpNotFound"
         assert condition["c-sharp.referenced"]["location"] == "METHOD"
 
-    def test_build_csharp_condition_with_class_location(self):
+    def test_build_csharp_condition_with_class_location(self, generator):
         """Should build c-sharp.referenced condition with CLASS location"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="HandleProcessCorruptedStateExceptionsAttribute",
             source_fqn="System.Runtime.ExceptionServices.HandleProcessCorruptedStateExceptionsAttribute",
@@ -1164,9 +1006,8 @@ class TestNodejsReferencedRules:
         assert "c-sharp.referenced" in condition
         assert condition["c-sharp.referenced"]["location"] == "CLASS"
 
-    def test_build_csharp_condition_with_field_location(self):
+    def test_build_csharp_condition_with_field_location(self, generator):
         """Should build c-sharp.referenced condition with FIELD location"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="FileSystemInfo.Attributes",
             source_fqn="System.IO.FileSystemInfo.Attributes",
@@ -1182,9 +1023,8 @@ class TestNodejsReferencedRules:
         assert "c-sharp.referenced" in condition
         assert condition["c-sharp.referenced"]["location"] == "FIELD"
 
-    def test_build_csharp_condition_defaults_to_all(self):
+    def test_build_csharp_condition_defaults_to_all(self, generator):
         """Should default to ALL location if not specified"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="IDispatchImplAttribute",
             source_fqn="System.Runtime.InteropServices.IDispatchImplAttribute",
@@ -1200,9 +1040,8 @@ class TestNodejsReferencedRules:
         # When location_type is None, no location field should be added (defaults to ALL)
         assert "location" not in condition["c-sharp.referenced"]
 
-    def test_build_csharp_condition_with_all_location(self):
+    def test_build_csharp_condition_with_all_location(self, generator):
         """Should build c-sharp.referenced condition with explicit ALL location"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="System.Web.Http",
             source_fqn="System.Web.Http.*",
@@ -1218,9 +1057,8 @@ class TestNodejsReferencedRules:
         assert "c-sharp.referenced" in condition
         assert condition["c-sharp.referenced"]["location"] == "ALL"
 
-    def test_build_csharp_condition_with_wildcard_pattern(self):
+    def test_build_csharp_condition_with_wildcard_pattern(self, generator):
         """Should build c-sharp.referenced condition with wildcard pattern"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="System.Web.Http",
             source_fqn="System.Web.Http.*",
@@ -1235,9 +1073,8 @@ class TestNodejsReferencedRules:
         assert "c-sharp.referenced" in condition
         assert condition["c-sharp.referenced"]["pattern"] == "System.Web.Http.*"
 
-    def test_build_csharp_condition_uses_source_pattern_fallback(self):
+    def test_build_csharp_condition_uses_source_pattern_fallback(self, generator):
         """Should use source_pattern if source_fqn not available"""
-        generator = AnalyzerRuleGenerator()
         pattern = MigrationPattern(
             source_pattern="ContextMenu",
             provider_type="csharp",
@@ -1326,10 +1163,8 @@ class TestNodejsReferencedRules:
             assert "nodejs.referenced" in rule.when
             assert "and" not in rule.when
 
-    def test_requires_semantic_analysis_detects_keywords(self):
+    def test_requires_semantic_analysis_detects_keywords(self, generator):
         """Should detect semantic analysis keywords in rationale"""
-        generator = AnalyzerRuleGenerator()
-
         # Test with function keyword
         pattern = MigrationPattern(
             source_pattern="foo",
@@ -1363,10 +1198,8 @@ class TestNodejsReferencedRules:
         )
         assert generator._requires_semantic_analysis(pattern) is True
 
-    def test_requires_semantic_analysis_returns_false_for_text_patterns(self):
+    def test_requires_semantic_analysis_returns_false_for_text_patterns(self, generator):
         """Should return False for patterns without semantic keywords"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="deprecated-value",
             source_fqn="deprecated-value",
@@ -1387,23 +1220,11 @@ class TestImportPatternRules:
             source_framework="patternfly-5", target_framework="patternfly-6"
         )
 
-        pattern = MigrationPattern(
-            source_pattern="import { Area } from '@patternfly/react-charts'",
-            source_fqn="import.*from '@patternfly/react-charts'",
-            provider_type="builtin",
-            file_pattern="\\.(j|t)sx?$",
-            complexity="LOW",
-            category="api",
-            rationale="Victory-based charts have moved to a 'victory' directory",
-        )
-
-        is_import = generator._is_import_pattern(pattern)
+        is_import = generator._is_import_pattern(CHART_IMPORT_PATTERN)
         assert is_import is True
 
-    def test_is_import_pattern_detects_import_in_rationale(self):
+    def test_is_import_pattern_detects_import_in_rationale(self, generator):
         """Should detect import patterns from rationale"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="@patternfly/react-charts",
             source_fqn="@patternfly/react-charts",
@@ -1416,10 +1237,8 @@ class TestImportPatternRules:
         is_import = generator._is_import_pattern(pattern)
         assert is_import is True
 
-    def test_is_import_pattern_requires_builtin_provider(self):
+    def test_is_import_pattern_requires_builtin_provider(self, generator):
         """Should require builtin provider for import detection"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="import { Component }",
             source_fqn="import { Component }",
@@ -1438,17 +1257,7 @@ class TestImportPatternRules:
             source_framework="patternfly-5", target_framework="patternfly-6"
         )
 
-        pattern = MigrationPattern(
-            source_pattern="import { Area } from '@patternfly/react-charts'",
-            source_fqn="import.*from '@patternfly/react-charts'",
-            provider_type="builtin",
-            file_pattern="\\.(j|t)sx?$",
-            complexity="LOW",
-            category="api",
-            rationale="Victory-based charts have moved to a 'victory' directory",
-        )
-
-        custom_vars = generator._build_custom_variables(pattern)
+        custom_vars = generator._build_custom_variables(CHART_IMPORT_PATTERN)
 
         assert len(custom_vars) == 1
         assert custom_vars[0]["name"] == "component"
@@ -1458,10 +1267,8 @@ class TestImportPatternRules:
         # Verify correct regex pattern (A-Za-z, not A-z which includes invalid chars)
         assert custom_vars[0]["pattern"] == "import {(?P<imports>[A-Za-z,\\s]+)}"
 
-    def test_build_custom_variables_returns_empty_for_non_import(self):
+    def test_build_custom_variables_returns_empty_for_non_import(self, generator):
         """Should return empty list for non-import patterns"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="OldClass",
             source_fqn="com.example.OldClass",
@@ -1474,10 +1281,8 @@ class TestImportPatternRules:
         custom_vars = generator._build_custom_variables(pattern)
         assert len(custom_vars) == 0
 
-    def test_build_when_condition_adds_dollar_anchor_for_imports(self):
+    def test_build_when_condition_adds_dollar_anchor_for_imports(self, generator):
         """Should add $ anchor to import patterns for precise matching"""
-        generator = AnalyzerRuleGenerator()
-
         pattern = MigrationPattern(
             source_pattern="import from '@patternfly/react-charts'",
             source_fqn="import.*from '@patternfly/react-charts'",
@@ -1498,10 +1303,25 @@ class TestImportPatternRules:
             == "import.*from '@patternfly/react-charts'$"
         )
 
-    def test_extract_package_name_from_import_statement(self):
-        """Should extract package name from import statement"""
-        generator = AnalyzerRuleGenerator()
+    def test_build_when_condition_skips_dollar_anchor_for_config_files(self, generator):
+        """Should not anchor import-like patterns that target configuration files"""
+        pattern = MigrationPattern(
+            source_pattern="import.legacy.enabled",
+            source_fqn="import\\.legacy\\.enabled",
+            provider_type="builtin",
+            file_pattern="*.properties",
+            complexity="LOW",
+            category="configuration",
+            rationale="Property renamed",
+        )
+
+        condition = generator._build_when_condition(pattern)
 
+        # Property keys are followed by values, so the pattern must stay unanchored
+        assert condition["builtin.filecontent"]["pattern"] == "import\\.legacy\\.enabled"
+
+    def test_extract_package_name_from_import_statement(self, generator):
+        """Should extract package name from import statement"""
         # Test with single quotes
         result = generator._extract_package_name("import { Area } from '@patternfly/react-charts'")
         assert result == "@patternfly/react-charts"
@@ -1516,18 +1336,7 @@ class TestImportPatternRules:
             source_framework="patternfly-5", target_framework="patternfly-6"
         )
 
-        pattern = MigrationPattern(
-            source_pattern="import { Area } from '@patternfly/react-charts'",
-            target_pattern="import { Area } from '@patternfly/react-charts/victory'",
-            source_fqn="import.*from '@patternfly/react-charts'",
-            provider_type="builtin",
-            file_pattern="\\.(j|t)sx?$",
-            complexity="LOW",
-            category="api",
-            rationale="Victory-based charts have moved to a 'victory' directory",
-        )
-
-        description = generator._build_description(pattern, has_custom_variables=True)
+        description = generator._build_description(CHART_IMPORT_PATTERN, has_custom_variables=True)
 
         # Should use generic "imports" instead of specific component
         assert "imports" in description